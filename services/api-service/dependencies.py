@@ -1,6 +1,7 @@
 """
 FastAPI dependencies for dependency injection
 """
+from typing import Callable, TypeVar
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from shared.database import get_db
@@ -19,28 +20,44 @@ from services import (
     SymbolFilterService
 )
 
+T = TypeVar('T')
+
+
+def _session_scoped(db: Session, key: str, factory: Callable[[], T]) -> T:
+    """Return the service cached on this session, building it on first use
+
+    get_db yields one Session per request and closes it afterwards, so
+    Session.info acts as a request-scoped cache with no cleanup needed.
+    """
+    service = db.info.get(key)
+    if service is None:
+        service = factory()
+        db.info[key] = service
+    return service
+
 
 def get_alert_service_from_db(db: Session = Depends(get_db)) -> AlertService:
     """Get alert service from existing session"""
-    return AlertService(AlertRepository(db))
+    return _session_scoped(db, "alert_service", lambda: AlertService(AlertRepository(db)))
 
 
 def get_candle_service_from_db(db: Session = Depends(get_db)) -> CandleService:
     """Get candle service from existing session"""
-    return CandleService(CandleRepository(db))
+    return _session_scoped(db, "candle_service", lambda: CandleService(CandleRepository(db)))
 
 
 def get_symbol_service_from_db(db: Session = Depends(get_db)) -> SymbolService:
     """Get symbol service from existing session"""
-    return SymbolService(SymbolRepository(db))
+    return _session_scoped(db, "symbol_service", lambda: SymbolService(SymbolRepository(db)))
 
 
 def get_config_service_from_db(db: Session = Depends(get_db)) -> ConfigService:
     """Get config service from existing session"""
-    return ConfigService(ConfigRepository(db))
+    return _session_scoped(db, "config_service", lambda: ConfigService(ConfigRepository(db)))
 
 
 def get_symbol_filter_service_from_db(db: Session = Depends(get_db)) -> SymbolFilterService:
     """Get symbol filter service from existing session"""
-    return SymbolFilterService(SymbolFilterRepository(db))
-
+    return _session_scoped(
+        db, "symbol_filter_service", lambda: SymbolFilterService(SymbolFilterRepository(db))
+    )
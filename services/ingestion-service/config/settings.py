@@ -58,6 +58,8 @@ try:
         ws_max_reconnect_delay: int = Field(default=60, alias="WS_MAX_RECONNECT_DELAY")
         ws_ping_interval: int = Field(default=20, alias="WS_PING_INTERVAL")
         ws_ping_timeout: int = Field(default=10, alias="WS_PING_TIMEOUT")
+        # permessage-deflate costs CPU per frame; only worth it when bandwidth-bound
+        ws_compression: bool = Field(default=False, alias="WS_COMPRESSION")
         
         # Database Configuration
         db_batch_size: int = Field(default=100, alias="DB_BATCH_SIZE")
@@ -140,5 +142,6 @@ WS_BATCH_TIMEOUT = settings.ws_batch_timeout
 WS_MAX_RECONNECT_DELAY = settings.ws_max_reconnect_delay
 WS_PING_INTERVAL = settings.ws_ping_interval
 WS_PING_TIMEOUT = settings.ws_ping_timeout
+WS_COMPRESSION = settings.ws_compression
 DB_BATCH_SIZE = settings.db_batch_size
 
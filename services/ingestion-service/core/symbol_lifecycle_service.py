@@ -15,7 +15,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 
 # Import from local modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from database.repository import normalize_symbol
+from database.repository import normalize_symbol, invalidate_symbol_cache_on_commit
 
 logger = structlog.get_logger(__name__)
 
@@ -23,7 +23,7 @@ logger = structlog.get_logger(__name__)
 class SymbolLifecycleService:
     """Service for managing symbol activation and deactivation"""
     
-    async def activate_symbols(self, db: Session, symbols: List[str]) -> int:
+    def activate_symbols(self, db: Session, symbols: List[str]) -> int:
         """Activate symbols (set is_active=True, removed_at=NULL)
         
         Args:
@@ -65,7 +65,7 @@ class SymbolLifecycleService:
             )
             raise
     
-    async def deactivate_symbols(self, db: Session, symbols: List[str]) -> int:
+    def deactivate_symbols(self, db: Session, symbols: List[str]) -> int:
         """Deactivate symbols (set is_active=FALSE, removed_at=NOW())
         
         Args:
@@ -96,6 +96,7 @@ class SymbolLifecycleService:
                 }
             )
             count = result.rowcount
+            invalidate_symbol_cache_on_commit(db, symbols)
             if count > 0:
                 logger.info(
                     "symbols_deactivated",
@@ -112,7 +113,7 @@ class SymbolLifecycleService:
             )
             raise
     
-    async def reactivate_symbols_meeting_criteria(
+    def reactivate_symbols_meeting_criteria(
         self,
         db: Session,
         min_market_cap: float,
@@ -1,6 +1,7 @@
 """Database repository module for ingestion service"""
 from .repository import (
     get_qualified_symbols,
+    get_qualified_symbols_and_timeframes,
     get_ingestion_timeframes,
     get_or_create_symbol_record,
     get_timeframe_id,
@@ -9,6 +10,7 @@ from .repository import (
 
 __all__ = [
     'get_qualified_symbols',
+    'get_qualified_symbols_and_timeframes',
     'get_ingestion_timeframes',
     'get_or_create_symbol_record',
     'get_timeframe_id',
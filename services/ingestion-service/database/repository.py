@@ -1,9 +1,13 @@
 """Database repository functions for ingestion service"""
 import sys
 import os
-from typing import List, Optional, Tuple, Dict
+import re
+import csv
+import io
+from typing import List, Optional, Tuple, Dict, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import event, text
+from psycopg2.extras import execute_values
 import structlog
 
 # Add shared to path
@@ -14,72 +18,280 @@ from config.settings import DEFAULT_SYMBOLS, DEFAULT_TIMEFRAME
 logger = structlog.get_logger(__name__)
 
 KNOWN_QUOTE_ASSETS = ["USDT", "USDC", "BUSD", "BTC", "ETH", "BNB", "USD", "EUR", "TRY", "BIDR"]
+# Lazy base + anchored suffix picks the longest matching quote (USDT before USD)
+_QUOTE_ASSET_RE = re.compile(
+    r"^(.+?)(" + "|".join(sorted(KNOWN_QUOTE_ASSETS, key=len, reverse=True)) + r")$"
+)
+
+CANDLE_COPY_MIN_ROWS = 1000  # Candle writers switch from execute_values to COPY at this size
+
+# ingestion_config keys read by symbol qualification, and their fallback value
+QUALIFICATION_CONFIG_KEYS = ("limit_volume_up", "limit_market_cap")
+DEFAULT_QUALIFICATION_THRESHOLD = 50000000.0
+
+# Symbol refresh statements, built once so every refresh reuses the same
+# construct and hits SQLAlchemy's compiled statement cache
+_QUALIFICATION_METADATA_SQL = text("""
+    SELECT 'config' AS kind, config_key AS name, config_value AS value,
+           config_type AS extra, 0 AS ord
+    FROM ingestion_config
+    WHERE config_key = ANY(:config_keys)
+    UNION ALL
+    SELECT 'filter', symbol, filter_type, NULL, 0
+    FROM symbol_filters
+    UNION ALL
+    SELECT 'timeframe', tf_name, NULL, NULL, seconds
+    FROM timeframe
+    ORDER BY kind, ord
+""")
+_QUALIFIED_SYMBOLS_SQL = text("""
+    SELECT s.symbol_name, md.market_cap, md.volume_24h
+    FROM symbols s
+    INNER JOIN (
+        SELECT DISTINCT ON (symbol_id)
+            symbol_id, market_cap, volume_24h
+        FROM market_data
+        WHERE market_cap IS NOT NULL
+        AND volume_24h IS NOT NULL
+        ORDER BY symbol_id, timestamp DESC
+    ) md ON s.symbol_id = md.symbol_id
+    WHERE s.is_active = TRUE
+    AND s.removed_at IS NULL
+    AND (
+        -- Whitelisted symbols: always include (skip market cap/volume checks)
+        UPPER(TRIM(BOTH '@' FROM s.symbol_name)) = ANY(:whitelisted)
+        OR
+        -- Non-blacklisted symbols that meet market cap/volume criteria
+        (UPPER(TRIM(BOTH '@' FROM s.symbol_name)) != ALL(:blacklisted)
+         AND md.market_cap >= :min_market_cap
+         AND md.volume_24h >= :min_volume)
+    )
+    ORDER BY md.market_cap DESC, s.symbol_name;
+""")
+
+# Process-local lookup caches. Only committed, active symbols that need no
+# update are cached; deactivation paths call invalidate_symbol_cache_on_commit.
+_SYMBOL_ID_CACHE: Dict[str, int] = {}
+_SYMBOL_IMAGE_CACHE: Dict[str, Optional[str]] = {}
+_TIMEFRAME_ID_CACHE: Dict[str, int] = {}
 
 
 def split_symbol_components(symbol: str) -> Tuple[str, str]:
     """Best-effort parsing of base/quote assets from a trading symbol"""
-    for quote in KNOWN_QUOTE_ASSETS:
-        if symbol.endswith(quote) and len(symbol) > len(quote):
-            return symbol[:-len(quote)], quote
+    match = _QUOTE_ASSET_RE.match(symbol)
+    if match:
+        return match.group(1), match.group(2)
     # Fallback: treat entire symbol as base and default quote to USD
     return symbol, "USD"
 
 
+def bulk_execute_values(
+    db: Session,
+    sql: str,
+    rows: Sequence[Tuple],
+    template: Optional[str] = None,
+    page_size: int = 1000,
+    fetch: bool = False
+) -> List[Tuple]:
+    """Run a multi-row statement through psycopg2's execute_values
+
+    Executes on the session's own connection, so the statement joins the
+    current transaction and the caller still decides when to commit.
+
+    Args:
+        db: Database session
+        sql: Statement containing a single ``VALUES %s`` placeholder
+        rows: Sequence of row tuples to expand into the VALUES list
+        template: Optional per-row template (e.g. with explicit casts)
+        page_size: Rows per generated statement (one round-trip per page)
+        fetch: Return rows produced by a RETURNING clause
+
+    Returns:
+        Returned rows when fetch=True, otherwise an empty list
+    """
+    if not rows:
+        return []
+
+    cursor = db.connection().connection.cursor()
+    try:
+        result = execute_values(cursor, sql, rows, template=template, page_size=page_size, fetch=fetch)
+        return result if fetch else []
+    finally:
+        cursor.close()
+
+
+def use_async_commit(db: Session) -> None:
+    """Let the current transaction commit without waiting for its WAL flush
+
+    SET LOCAL ends with the transaction. Only for re-fetchable market data:
+    a crash can lose the last few commits but never leaves them corrupt.
+    """
+    db.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+
+# Conflict action for candle upserts that overwrite stored OHLCV; re-sent
+# identical candles skip the row rewrite (no new tuple, WAL or index churn)
+_CANDLE_CONFLICT_UPDATE = """
+            DO UPDATE SET
+                open = EXCLUDED.open,
+                high = EXCLUDED.high,
+                low = EXCLUDED.low,
+                close = EXCLUDED.close,
+                volume = EXCLUDED.volume
+            WHERE (ohlcv_candles.open, ohlcv_candles.high, ohlcv_candles.low,
+                   ohlcv_candles.close, ohlcv_candles.volume)
+                IS DISTINCT FROM
+                  (EXCLUDED.open, EXCLUDED.high, EXCLUDED.low,
+                   EXCLUDED.close, EXCLUDED.volume)
+"""
+
+
+def copy_candles(db: Session, rows: Sequence[Tuple], update_existing: bool = False) -> None:
+    """Bulk-load candle rows with COPY through a temp staging table
+    
+    Rows use the save_candles layout (symbol_id, timeframe_id, timestamp,
+    open, high, low, close, volume). The staging table is session-private and
+    emptied on commit, so concurrent loaders never see each other's rows.
+    Like bulk_execute_values it joins the current transaction without committing.
+    
+    By default existing candles are kept; update_existing overwrites their
+    OHLCV instead, in which case rows must not repeat a (symbol_id,
+    timeframe_id, timestamp) key.
+    """
+    if not rows:
+        return
+    
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS ohlcv_candles_staging (
+                symbol_id INTEGER NOT NULL,
+                timeframe_id INTEGER NOT NULL,
+                timestamp TIMESTAMPTZ NOT NULL,
+                open DECIMAL(20, 8) NOT NULL,
+                high DECIMAL(20, 8) NOT NULL,
+                low DECIMAL(20, 8) NOT NULL,
+                close DECIMAL(20, 8) NOT NULL,
+                volume DECIMAL(30, 8) NOT NULL
+            ) ON COMMIT DELETE ROWS
+        """)
+        cursor.copy_expert(
+            """
+            COPY ohlcv_candles_staging
+            (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
+            FROM STDIN WITH (FORMAT csv)
+            """,
+            buffer
+        )
+        cursor.execute("""
+            INSERT INTO ohlcv_candles
+            (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
+            SELECT symbol_id, timeframe_id, timestamp, open, high, low, close, volume
+            FROM ohlcv_candles_staging
+            ON CONFLICT (symbol_id, timeframe_id, timestamp)
+        """ + (_CANDLE_CONFLICT_UPDATE if update_existing else "DO NOTHING"))
+        # Several loads may share one transaction, so clear staging right away
+        cursor.execute("TRUNCATE ohlcv_candles_staging")
+    finally:
+        cursor.close()
+
+
+def invalidate_symbol_cache(symbols: Optional[Sequence[str]] = None):
+    """Drop cached symbol lookups (all of them when symbols is None)"""
+    if symbols is None:
+        _SYMBOL_ID_CACHE.clear()
+        _SYMBOL_IMAGE_CACHE.clear()
+        return
+    for symbol in symbols:
+        _SYMBOL_ID_CACHE.pop(symbol, None)
+        _SYMBOL_IMAGE_CACHE.pop(symbol, None)
+
+
+def invalidate_symbol_cache_on_commit(db: Session, symbols: Optional[Sequence[str]] = None):
+    """Drop cached symbol lookups once db's transaction commits
+    
+    Invalidating before the commit would let a concurrent session (e.g. the
+    candle writer thread) re-cache the still-active pre-commit row.
+    """
+    symbols = list(symbols) if symbols is not None else None
+    event.listen(db, "after_commit", lambda session: invalidate_symbol_cache(symbols), once=True)
+
+
+def warm_lookup_caches(db: Session) -> Tuple[int, int]:
+    """Preload the symbol and timeframe id caches (two queries at startup)
+    
+    Only active symbols are loaded, matching what get_or_create_symbol_record
+    would cache after a no-op upsert.
+    
+    Returns:
+        (symbols_cached, timeframes_cached)
+    """
+    symbol_rows = db.execute(
+        text("""
+            SELECT symbol_name, symbol_id, image_path
+            FROM symbols
+            WHERE is_active = TRUE AND removed_at IS NULL
+        """)
+    ).fetchall()
+    for symbol_name, symbol_id, image_path in symbol_rows:
+        _SYMBOL_ID_CACHE[symbol_name] = symbol_id
+        _SYMBOL_IMAGE_CACHE[symbol_name] = image_path
+    
+    timeframe_rows = db.execute(text("SELECT tf_name, timeframe_id FROM timeframe")).fetchall()
+    for tf_name, timeframe_id in timeframe_rows:
+        _TIMEFRAME_ID_CACHE[tf_name] = timeframe_id
+    
+    logger.info(
+        "lookup_caches_warmed",
+        symbols=len(symbol_rows),
+        timeframes=len(timeframe_rows)
+    )
+    return len(symbol_rows), len(timeframe_rows)
+
+
 def get_or_create_symbol_record(db: Session, symbol: str, image_path: Optional[str] = None) -> Optional[int]:
     """Ensure symbol exists in symbols table and return symbol_id.
     
     If symbol exists but is inactive, it will be reactivated (is_active=True, removed_at=NULL).
+    A cache hit returns the id without touching the row; only active rows are
+    cached, and deactivation drops them from the cache once it commits.
     """
+    cached_id = _SYMBOL_ID_CACHE.get(symbol)
+    # A hit is only valid if it would not need an image_path backfill
+    if cached_id is not None and not (image_path and _SYMBOL_IMAGE_CACHE.get(symbol) is None):
+        return cached_id
+    
     try:
-        result = db.execute(
-            text("SELECT symbol_id, is_active, image_path FROM symbols WHERE symbol_name = :symbol"),
-            {"symbol": symbol}
-        ).fetchone()
-        
-        if result:
-            symbol_id, is_active, current_image_path = result
-            # Reactivate if inactive, update image_path if provided and current is NULL
-            needs_update = False
-            update_fields = []
-            update_params = {"symbol_id": symbol_id}
-            
-            if not is_active:
-                needs_update = True
-                update_fields.append("is_active = TRUE")
-                update_fields.append("removed_at = NULL")
-                logger.debug("symbol_reactivated_during_creation", symbol=symbol)
-            
-            # Update image_path if provided and current is NULL
-            if image_path and current_image_path is None:
-                needs_update = True
-                update_fields.append("image_path = :image_path")
-                update_params["image_path"] = image_path
-            
-            if needs_update:
-                update_fields.append("updated_at = NOW()")
-                db.execute(
-                    text(f"""
-                        UPDATE symbols
-                        SET {', '.join(update_fields)}
-                        WHERE symbol_id = :symbol_id
-                    """),
-                    update_params
-                )
-            
-            return symbol_id
-        
-        # Create new symbol (automatically active)
+        # Single round-trip upsert. The WHERE clause skips the row rewrite when
+        # nothing changes (already active, image_path set or not provided); in
+        # that case the CTE returns nothing and the fallback SELECT, which
+        # reads the pre-statement snapshot, supplies the existing row. When
+        # both return a row, ORDER BY picks the written (post-update) one.
         base_asset, quote_asset = split_symbol_components(symbol)
         result = db.execute(
             text("""
-                INSERT INTO symbols (symbol_name, base_asset, quote_asset, image_path, is_active, removed_at)
-                VALUES (:symbol, :base_asset, :quote_asset, :image_path, TRUE, NULL)
-                ON CONFLICT (symbol_name) DO UPDATE SET
-                    image_path = COALESCE(EXCLUDED.image_path, symbols.image_path),
-                    is_active = TRUE,
-                    removed_at = NULL,
-                    updated_at = NOW()
-                RETURNING symbol_id
+                WITH upserted AS (
+                    INSERT INTO symbols (symbol_name, base_asset, quote_asset, image_path, is_active, removed_at)
+                    VALUES (:symbol, :base_asset, :quote_asset, :image_path, TRUE, NULL)
+                    ON CONFLICT (symbol_name) DO UPDATE SET
+                        image_path = COALESCE(symbols.image_path, EXCLUDED.image_path),
+                        is_active = TRUE,
+                        removed_at = NULL,
+                        updated_at = NOW()
+                    WHERE NOT symbols.is_active
+                        OR symbols.removed_at IS NOT NULL
+                        OR (symbols.image_path IS NULL AND EXCLUDED.image_path IS NOT NULL)
+                    RETURNING symbol_id, image_path, TRUE AS written
+                )
+                SELECT symbol_id, image_path, written FROM upserted
+                UNION ALL
+                SELECT symbol_id, image_path, FALSE FROM symbols WHERE symbol_name = :symbol
+                ORDER BY written DESC
+                LIMIT 1
             """),
             {
                 "symbol": symbol,
@@ -87,8 +299,18 @@ def get_or_create_symbol_record(db: Session, symbol: str, image_path: Optional[s
                 "quote_asset": quote_asset,
                 "image_path": image_path
             }
-        ).scalar()
-        return result
+        ).fetchone()
+        if result is None:
+            return None
+        
+        symbol_id, current_image_path, written = result
+        if written:
+            logger.debug("symbol_record_upserted", symbol=symbol)
+        else:
+            # Row is active and needs no update, so the id is safe to reuse
+            _SYMBOL_ID_CACHE[symbol] = symbol_id
+            _SYMBOL_IMAGE_CACHE[symbol] = current_image_path
+        return symbol_id
     except Exception as e:
         logger.error(
             "symbol_record_error",
@@ -99,13 +321,114 @@ def get_or_create_symbol_record(db: Session, symbol: str, image_path: Optional[s
         return None
 
 
+def get_symbol_ids(db: Session, symbols: Sequence[str]) -> Dict[str, int]:
+    """Resolve symbol_ids for existing symbols in one query (does not create)"""
+    if not symbols:
+        return {}
+    rows = db.execute(
+        text("SELECT symbol_name, symbol_id FROM symbols WHERE symbol_name = ANY(:symbols)"),
+        {"symbols": list(symbols)}
+    ).fetchall()
+    return {symbol_name: symbol_id for symbol_name, symbol_id in rows}
+
+
+def get_or_create_symbol_records(db: Session, symbol_images: Dict[str, Optional[str]]) -> Dict[str, int]:
+    """Batched get_or_create_symbol_record: one SELECT, one UPDATE, one INSERT
+    
+    Args:
+        db: Database session
+        symbol_images: Mapping of symbol name to image path (or None)
+        
+    Returns:
+        Mapping of symbol name to symbol_id
+    """
+    if not symbol_images:
+        return {}
+    
+    rows = db.execute(
+        text("""
+            SELECT symbol_name, symbol_id, is_active, removed_at, image_path
+            FROM symbols
+            WHERE symbol_name = ANY(:symbols)
+        """),
+        {"symbols": list(symbol_images)}
+    ).fetchall()
+    
+    symbol_ids: Dict[str, int] = {}
+    stale_rows = []
+    for symbol, symbol_id, is_active, removed_at, current_image_path in rows:
+        symbol_ids[symbol] = symbol_id
+        image_path = symbol_images[symbol]
+        # Same rules as get_or_create_symbol_record: reactivate (inactive or
+        # removed), backfill NULL image_path
+        if not is_active or removed_at is not None or (image_path and current_image_path is None):
+            stale_rows.append((symbol_id, image_path))
+        else:
+            _SYMBOL_ID_CACHE[symbol] = symbol_id
+            _SYMBOL_IMAGE_CACHE[symbol] = current_image_path
+    
+    bulk_execute_values(
+        db,
+        """
+        UPDATE symbols
+        SET is_active = TRUE,
+            removed_at = NULL,
+            image_path = COALESCE(symbols.image_path, v.image_path),
+            updated_at = NOW()
+        FROM (VALUES %s) AS v(symbol_id, image_path)
+        WHERE symbols.symbol_id = v.symbol_id
+        """,
+        stale_rows,
+        template="(%s, %s::text)"
+    )
+    
+    missing_rows = []
+    for symbol, image_path in symbol_images.items():
+        if symbol not in symbol_ids:
+            base_asset, quote_asset = split_symbol_components(symbol)
+            missing_rows.append((symbol, base_asset, quote_asset, image_path))
+    
+    inserted = bulk_execute_values(
+        db,
+        """
+        INSERT INTO symbols (symbol_name, base_asset, quote_asset, image_path, is_active, removed_at)
+        VALUES %s
+        ON CONFLICT (symbol_name) DO UPDATE SET
+            image_path = COALESCE(EXCLUDED.image_path, symbols.image_path),
+            is_active = TRUE,
+            removed_at = NULL,
+            updated_at = NOW()
+        RETURNING symbol_name, symbol_id
+        """,
+        missing_rows,
+        template="(%s, %s, %s, %s, TRUE, NULL)",
+        fetch=True
+    )
+    symbol_ids.update(dict(inserted))
+    
+    if stale_rows or missing_rows:
+        logger.debug(
+            "symbol_records_upserted",
+            updated=len(stale_rows),
+            created=len(missing_rows)
+        )
+    return symbol_ids
+
+
 def get_timeframe_id(db: Session, timeframe: str) -> Optional[int]:
     """Get timeframe_id for given timeframe string"""
+    cached_id = _TIMEFRAME_ID_CACHE.get(timeframe)
+    if cached_id is not None:
+        return cached_id
+    
     try:
-        return db.execute(
+        timeframe_id = db.execute(
             text("SELECT timeframe_id FROM timeframe WHERE tf_name = :tf LIMIT 1"),
             {"tf": timeframe}
         ).scalar()
+        if timeframe_id is not None:
+            _TIMEFRAME_ID_CACHE[timeframe] = timeframe_id
+        return timeframe_id
     except Exception as e:
         logger.error(
             "timeframe_id_error",
@@ -116,6 +439,66 @@ def get_timeframe_id(db: Session, timeframe: str) -> Optional[int]:
         return None
 
 
+def get_market_data_age(db: Session) -> Optional[float]:
+    """Seconds since the newest market_data row was written, or None if empty (PURE QUERY)"""
+    age = db.execute(
+        text("SELECT EXTRACT(EPOCH FROM NOW() - MAX(timestamp)) FROM market_data")
+    ).scalar()
+    return max(0.0, float(age)) if age is not None else None
+
+
+def get_qualification_metadata(db: Session) -> Tuple[float, float, set, set, List[str]]:
+    """Load everything symbol qualification needs in one round-trip (PURE QUERY)
+    
+    The volume/market cap thresholds, whitelist/blacklist filters and the
+    ingestion timeframes are small lookup tables, so they are fetched as one
+    UNION ALL tagged by kind and partitioned here.
+    
+    Returns:
+        (min_volume, min_market_cap, whitelisted_symbols, blacklisted_symbols, timeframes)
+    """
+    rows = db.execute(
+        _QUALIFICATION_METADATA_SQL,
+        {"config_keys": list(QUALIFICATION_CONFIG_KEYS)}
+    ).fetchall()
+    
+    config_values = {key: DEFAULT_QUALIFICATION_THRESHOLD for key in QUALIFICATION_CONFIG_KEYS}
+    whitelisted_symbols = set()
+    blacklisted_symbols = set()
+    timeframes = []
+    for kind, name, value, extra, _ in rows:
+        if kind == "config":
+            config_values[name] = _parse_number_config(
+                name, value, extra, DEFAULT_QUALIFICATION_THRESHOLD
+            )
+        elif kind == "filter":
+            if value == "whitelist":
+                whitelisted_symbols.add(name)
+            elif value == "blacklist":
+                blacklisted_symbols.add(name)
+        else:
+            timeframes.append(name)
+    
+    if timeframes:
+        logger.info("ingestion_timeframes_loaded", timeframes=timeframes, count=len(timeframes))
+    else:
+        logger.warning("timeframe_fallback", default_timeframe=DEFAULT_TIMEFRAME)
+        timeframes = [DEFAULT_TIMEFRAME]
+    
+    logger.info(
+        "symbol_filters_loaded",
+        whitelist_count=len(whitelisted_symbols),
+        blacklist_count=len(blacklisted_symbols)
+    )
+    return (
+        config_values["limit_volume_up"],
+        config_values["limit_market_cap"],
+        whitelisted_symbols,
+        blacklisted_symbols,
+        timeframes,
+    )
+
+
 def get_qualified_symbols(db: Session) -> List[str]:
     """Get symbols from database that meet market cap and volume criteria (PURE QUERY - NO SIDE EFFECTS)
     
@@ -130,58 +513,31 @@ def get_qualified_symbols(db: Session) -> List[str]:
     Returns:
         List of qualified symbol names
     """
+    return get_qualified_symbols_and_timeframes(db)[0]
+
+
+def get_qualified_symbols_and_timeframes(db: Session) -> Tuple[List[str], List[str]]:
+    """Qualified symbols plus ingestion timeframes in two round-trips (PURE QUERY)
+    
+    Same filtering rules as get_qualified_symbols; the thresholds, filters and
+    timeframes come from get_qualification_metadata.
+    """
+    try:
+        (
+            min_volume,
+            min_market_cap,
+            whitelisted_symbols,
+            blacklisted_symbols,
+            timeframes,
+        ) = get_qualification_metadata(db)
+    except Exception as e:
+        logger.error("qualification_metadata_error", error=str(e), exc_info=True)
+        return DEFAULT_SYMBOLS, [DEFAULT_TIMEFRAME]
+    
     try:
-        # Get ingestion config thresholds
-        min_volume = get_ingestion_config_value(db, "limit_volume_up", default_value=50000000.0)
-        min_market_cap = get_ingestion_config_value(db, "limit_market_cap", default_value=50000000.0)
-        
-        min_volume = min_volume if min_volume is not None else 50000000.0
-        min_market_cap = min_market_cap if min_market_cap is not None else 50000000.0
-        
-        # Get whitelisted and blacklisted symbols
-        whitelisted_symbols = set()
-        blacklisted_symbols = set()
-        filter_results = get_symbol_filters(db)
-        for filter_item in filter_results:
-            symbol = filter_item["symbol"]
-            filter_type = filter_item["filter_type"]
-            if filter_type == "whitelist":
-                whitelisted_symbols.add(symbol)
-            elif filter_type == "blacklist":
-                blacklisted_symbols.add(symbol)
-        
-        logger.info(
-            "symbol_filters_loaded",
-            whitelist_count=len(whitelisted_symbols),
-            blacklist_count=len(blacklisted_symbols)
-        )
-        
         # Get all qualified symbols (PURE QUERY - NO UPDATES)
         result = db.execute(
-            text("""
-                SELECT s.symbol_name, md.market_cap, md.volume_24h
-                FROM symbols s
-                INNER JOIN (
-                    SELECT DISTINCT ON (symbol_id)
-                        symbol_id, market_cap, volume_24h
-                    FROM market_data
-                    WHERE market_cap IS NOT NULL
-                    AND volume_24h IS NOT NULL
-                    ORDER BY symbol_id, timestamp DESC
-                ) md ON s.symbol_id = md.symbol_id
-                WHERE s.is_active = TRUE
-                AND s.removed_at IS NULL
-                AND (
-                    -- Whitelisted symbols: always include (skip market cap/volume checks)
-                    UPPER(TRIM(BOTH '@' FROM s.symbol_name)) = ANY(:whitelisted)
-                    OR
-                    -- Non-blacklisted symbols that meet market cap/volume criteria
-                    (UPPER(TRIM(BOTH '@' FROM s.symbol_name)) != ALL(:blacklisted)
-                     AND md.market_cap >= :min_market_cap
-                     AND md.volume_24h >= :min_volume)
-                )
-                ORDER BY md.market_cap DESC, s.symbol_name;
-            """),
+            _QUALIFIED_SYMBOLS_SQL,
             {
                 "min_market_cap": min_market_cap,
                 "min_volume": min_volume,
@@ -216,10 +572,10 @@ def get_qualified_symbols(db: Session) -> List[str]:
             min_market_cap=min_market_cap,
             min_volume=min_volume
         )
-        return symbols
+        return symbols, timeframes
     except Exception as e:
         logger.error("qualified_symbols_error", error=str(e), exc_info=True)
-        return DEFAULT_SYMBOLS
+        return DEFAULT_SYMBOLS, timeframes
 
 
 def find_symbols_to_reactivate(
@@ -352,6 +708,33 @@ def get_strategy_config_value(db: Session, config_key: str, default_value: Optio
         return default_value
 
 
+def _parse_number_config(
+    config_key: str,
+    config_value: str,
+    config_type: str,
+    default_value: Optional[float]
+) -> Optional[float]:
+    """Convert a 'number' ingestion_config row to float, or default_value"""
+    if config_type == 'number':
+        try:
+            return float(config_value)
+        except (ValueError, TypeError):
+            logger.warning(
+                "ingestion_config_value_parse_error",
+                config_key=config_key,
+                config_value=config_value,
+                config_type=config_type
+            )
+            return default_value
+    logger.warning(
+        "ingestion_config_type_mismatch",
+        config_key=config_key,
+        expected_type="number",
+        actual_type=config_type
+    )
+    return default_value
+
+
 def get_ingestion_config_value(db: Session, config_key: str, default_value: Optional[float] = None) -> Optional[float]:
     """Get ingestion config value from database, returning as float for numeric types
     
@@ -375,25 +758,7 @@ def get_ingestion_config_value(db: Session, config_key: str, default_value: Opti
         
         if result:
             config_value, config_type = result
-            if config_type == 'number':
-                try:
-                    return float(config_value)
-                except (ValueError, TypeError):
-                    logger.warning(
-                        "ingestion_config_value_parse_error",
-                        config_key=config_key,
-                        config_value=config_value,
-                        config_type=config_type
-                    )
-                    return default_value
-            else:
-                logger.warning(
-                    "ingestion_config_type_mismatch",
-                    config_key=config_key,
-                    expected_type="number",
-                    actual_type=config_type
-                )
-                return default_value
+            return _parse_number_config(config_key, config_value, config_type, default_value)
         
         logger.debug(f"Ingestion config key '{config_key}' not found in database, using default: {default_value}")
         return default_value
@@ -21,7 +21,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from shared.database import DatabaseManager
-from database.repository import split_symbol_components
+from database.repository import split_symbol_components, invalidate_symbol_cache_on_commit
 
 logger = structlog.get_logger(__name__)
 
@@ -148,6 +148,7 @@ def sync_watchlist(db: Session, watchlist_symbols: List[str]) -> Dict[str, int]:
                 }
             )
             stats["deactivated"] = len(symbols_to_deactivate)
+            invalidate_symbol_cache_on_commit(db, symbols_to_deactivate)
             logger.info("symbols_deactivated", count=stats["deactivated"], symbols=list(symbols_to_deactivate))
         
         # Commit all changes
@@ -358,6 +359,7 @@ def cleanup_old_inactive_symbols(
             {"symbol_ids": symbol_ids}
         )
         logger.info("cleanup_deleted_symbols", count=len(symbol_ids))
+        invalidate_symbol_cache_on_commit(db)
         
         # Commit all deletions
         db.commit()
@@ -7,7 +7,8 @@ import os
 import asyncio
 import signal
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Coroutine, List, Optional, Set
+import aiohttp
 from sqlalchemy import text
 import structlog
 
@@ -16,6 +17,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
 
 from shared.database import init_db, DatabaseManager
 from shared.redis_client import publish_event, get_redis
+from shared.logger import start_queue_logging
 import logging
 
 # Configure standard logging
@@ -25,6 +27,8 @@ logging.basicConfig(
     stream=sys.stdout,
     force=True
 )
+# stdout writes happen on a listener thread, off the event loop
+start_queue_logging()
 # Configure structlog
 structlog.configure(
     processors=[
@@ -53,131 +57,307 @@ from config.settings import (
 from services.binance_service import BinanceIngestionService
 from services.coingecko_service import CoinGeckoIngestionService
 from services.websocket_service import BinanceWebSocketService
-from database.repository import get_qualified_symbols, get_ingestion_timeframes, find_symbols_to_reactivate, get_symbol_filters
+from database.repository import get_qualified_symbols_and_timeframes, get_qualification_metadata, get_market_data_age, get_ingestion_timeframes, warm_lookup_caches, find_symbols_to_reactivate
 from utils.gap_detection import backfill_all_symbols_timeframes
 from core.symbol_manager import SymbolManager
 from core.symbol_lifecycle_service import SymbolLifecycleService
+from utils.http_client import create_http_session
+from utils.scheduler import JOB_BACKOFF_BASE, PeriodicScheduler
 
 # Global shutdown flag
 shutdown_event = asyncio.Event()
 
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+_background_tasks: Set[asyncio.Task] = set()
 
-async def periodic_market_data_update():
-    """Background task to update market data every 5 minutes with metrics"""
-    logger.info("periodic_market_data_update_started")
-    while True:
-        try:                        
-            start_time = datetime.now()
-            await asyncio.sleep(300)  # Wait 5 minutes
+# Scheduled job intervals (seconds)
+MARKET_DATA_UPDATE_INTERVAL = 300
+GAP_DETECTION_INTERVAL = 3600
+GAP_DETECTION_RETRY_DELAY = 300
+METRICS_LOG_INTERVAL = 300
+PERPETUALS_REFRESH_INTERVAL = 3600  # Market data younger than this defers the startup refresh
+CONFIG_LISTENER_STOP_TIMEOUT = 5  # Seconds to wait for the config listener on shutdown
+
+
+def run_in_session(func, *args):
+    """Run a blocking repository function in its own short-lived session
+    
+    Meant for asyncio.to_thread so metadata queries don't stall the event loop.
+    """
+    with DatabaseManager() as db:
+        return func(db, *args)
+
+
+def load_symbols_with_market_data(db) -> List[str]:
+    """Active symbols that already have market data rows"""
+    result = db.execute(
+        text("""
+            SELECT DISTINCT s.symbol_name
+            FROM symbols s
+            INNER JOIN market_data md ON s.symbol_id = md.symbol_id
+            WHERE s.is_active = TRUE AND s.removed_at is NULL
+            ORDER BY s.symbol_name
+        """)
+    ).fetchall()
+    return [row[0] for row in result]
+
+
+def reconcile_symbol_lifecycle(db, apply_filters: bool = False) -> List[str]:
+    """Reactivate symbols meeting the qualification criteria and commit
+    
+    With apply_filters, whitelisted symbols are activated and blacklisted
+    ones deactivated first (config changes). Blocking; run via run_in_session.
+    
+    Returns:
+        Reactivated symbol names
+    """
+    min_volume, min_market_cap, whitelisted_symbols, blacklisted_symbols, _ = get_qualification_metadata(db)
+    lifecycle_service = SymbolLifecycleService()
+    
+    if apply_filters:
+        if whitelisted_symbols:
+            lifecycle_service.activate_symbols(db, list(whitelisted_symbols))
+        if blacklisted_symbols:
+            lifecycle_service.deactivate_symbols(db, list(blacklisted_symbols))
+    
+    reactivated_symbols = lifecycle_service.reactivate_symbols_meeting_criteria(
+        db, min_market_cap, min_volume, whitelisted_symbols, blacklisted_symbols
+    )
+    db.commit()
+    return reactivated_symbols
+
+
+async def refresh_perpetuals(
+    binance_service: BinanceIngestionService,
+    http_session: aiohttp.ClientSession
+) -> List[str]:
+    """Discover Binance perpetuals, enrich with CoinGecko and save
+    
+    Newly activated symbols are backfilled in the background.
+    
+    Returns:
+        Newly activated symbol names
+    
+    Raises:
+        RuntimeError: nothing was fetched (e.g. Binance unreachable), so nothing was saved
+    """
+    async with CoinGeckoIngestionService(http_session) as coingecko_service:
+        ingestion_result = await coingecko_service.ingest_from_binance_perpetuals_and_save(
+            binance_service=binance_service
+        )
+    if ingestion_result is None:
+        raise RuntimeError("perpetuals refresh fetched no assets")
+    
+    newly_activated = ingestion_result.get("newly_activated_symbols", [])
+    logger.info(
+        "binance_perpetuals_ingestion_completed",
+        newly_activated=len(newly_activated),
+    )
+    if newly_activated:
+        logger.info(
+            "backfilling_symbols_from_binance_ingestion",
+            count=len(newly_activated),
+            symbols=newly_activated[:10] if len(newly_activated) > 10 else newly_activated,
+        )
+        spawn_background_task(
+            backfill_reactivated_symbols(newly_activated, binance_service),
+            name="backfill_newly_activated_symbols"
+        )
+    return newly_activated
+
+
+async def run_deferred_perpetuals_refresh(
+    binance_service: BinanceIngestionService,
+    http_session: aiohttp.ClientSession,
+    symbol_manager: SymbolManager
+):
+    """One-shot job: the startup refresh that was skipped (fresh data) or failed
+    
+    Repeats the rest of the startup sequence as well: the reactivation pass
+    (whitelisted and qualifying symbols) and a reload of the qualified symbols
+    into symbol_manager, so WebSocket subscriptions follow the new listings.
+    Raises on failure so the scheduler retries with backoff.
+    """
+    await refresh_perpetuals(binance_service, http_session)
+    
+    reactivated_symbols = await asyncio.to_thread(run_in_session, reconcile_symbol_lifecycle)
+    symbols, timeframes = await asyncio.to_thread(run_in_session, get_qualified_symbols_and_timeframes)
+    if reactivated_symbols:
+        spawn_background_task(
+            backfill_reactivated_symbols(reactivated_symbols, binance_service, timeframes),
+            name="backfill_reactivated_symbols"
+        )
+    if symbols:
+        await symbol_manager.update_symbols(symbols, timeframes)
+
+
+async def update_market_data(
+    binance_service: BinanceIngestionService,
+    http_session: aiohttp.ClientSession
+):
+    """Scheduled job: update market data for all symbols with metrics (every 5 minutes)"""
+    try:
+        start_time = datetime.now()
+        
+        # Get all symbols from database that have market data
+        symbols = await asyncio.to_thread(run_in_session, load_symbols_with_market_data)
+        
+        if symbols:
+            logger.info("periodic_market_data_update_starting", symbol_count=len(symbols))
+            # Fresh CoinGecko service so edits to the mapping/blacklist files are picked up
+            async with CoinGeckoIngestionService(http_session) as coingecko_service:
+                await coingecko_service.update_market_data_for_symbols(
+                    symbols, binance_service=binance_service
+                )
             
-            # Get all symbols from database that have market data
-            with DatabaseManager() as db:
-                result = db.execute(
-                    text("""
-                        SELECT DISTINCT s.symbol_name
-                        FROM symbols s
-                        INNER JOIN market_data md ON s.symbol_id = md.symbol_id
-                        WHERE s.is_active = TRUE AND s.removed_at is NULL
-                        ORDER BY s.symbol_name
-                    """)
-                ).fetchall()
-                symbols = [row[0] for row in result]
+            # Calculate metrics
+            duration = (datetime.now() - start_time).total_seconds()
+            symbols_per_second = len(symbols) / duration if duration > 0 else 0
             
-            if symbols:
-                logger.info("periodic_market_data_update_starting", symbol_count=len(symbols))
-                # Create service instances for this update
-                async with BinanceIngestionService() as binance_service:
-                    async with CoinGeckoIngestionService() as coingecko_service:
-                        await coingecko_service.update_market_data_for_symbols(
-                            symbols, binance_service=binance_service
-                        )
-                
-                # Calculate metrics
-                duration = (datetime.now() - start_time).total_seconds()
-                symbols_per_second = len(symbols) / duration if duration > 0 else 0
-                
-                logger.info(
-                    "periodic_market_data_update_completed",
-                    symbol_count=len(symbols),
-                    duration_seconds=duration,
-                    symbols_per_second=symbols_per_second
-                )
-            else:
-                logger.warning("periodic_market_data_update_no_symbols")
-
-        except asyncio.CancelledError:
-            logger.info("periodic_market_data_update_cancelled")
-            break
-        except Exception as e:
-            logger.error(
-                "periodic_market_data_update_error",
-                error=str(e),
-                exc_info=True
+            logger.info(
+                "periodic_market_data_update_completed",
+                symbol_count=len(symbols),
+                duration_seconds=duration,
+                symbols_per_second=symbols_per_second
             )
-            await asyncio.sleep(60)  # Wait 1 minute before retrying
+        else:
+            logger.warning("periodic_market_data_update_no_symbols")
+    
+    except asyncio.CancelledError:
+        logger.info("periodic_market_data_update_cancelled")
+        raise
+    except Exception as e:
+        logger.error(
+            "periodic_market_data_update_error",
+            error=str(e),
+            exc_info=True
+        )
+        raise  # Scheduler retries with backoff
+
+
+def _on_background_task_done(task: asyncio.Task):
+    """Drop the finished task and log any exception it ended with"""
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error("background_task_failed", task=task.get_name(), error=str(error), exc_info=error)
+
+
+def spawn_background_task(coro: Coroutine, name: Optional[str] = None) -> asyncio.Task:
+    """Start a fire-and-forget task that is kept alive and whose failure is logged"""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+def _shutdown_on_failure(task: asyncio.Task):
+    """Done-callback for tasks the process can't run without: fail -> shut down"""
+    if task.cancelled() or task.exception() is None:
+        return
+    logger.error(
+        "critical_task_failed",
+        task=task.get_name(),
+        error=str(task.exception()),
+        exc_info=task.exception()
+    )
+    shutdown_event.set()
 
 
 def setup_signal_handlers():
-    """Setup signal handlers for graceful shutdown"""
-    def signal_handler(signum, frame):
+    """Setup signal handlers for graceful shutdown
+    
+    Registered on the running loop so SIGTERM/SIGINT wake it and set
+    shutdown_event from loop context; every long-running task watches that
+    event and winds down cooperatively.
+    """
+    loop = asyncio.get_running_loop()
+    
+    def signal_handler(signum):
         logger.info("shutdown_signal_received", signal=signum)
         shutdown_event.set()
     
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, signal_handler, signum)
 
 
-async def gap_detection_task(symbol_manager: SymbolManager, timeframes: list):
-    """Periodic task to backfill recent candles for all symbols and timeframes
+async def run_gap_detection(
+    symbol_manager: SymbolManager,
+    timeframes: list,
+    binance_service: BinanceIngestionService
+) -> Optional[float]:
+    """Scheduled job: backfill recent candles for all symbols and timeframes (hourly)
     Uses symbol_manager to get current symbols
+    
+    Returns:
+        Retry delay in seconds when the run should be repeated before the next hour
     """
-    while not shutdown_event.is_set():
-        try:
-            if shutdown_event.is_set():
-                break
-            
-            logger.info("gap_detection_starting")
-            
-            # Get current symbols from symbol manager (thread-safe)
-            symbols_to_use = await symbol_manager.get_symbols()
-            
-            if not symbols_to_use:
-                logger.warning("gap_detection_no_symbols")
-                await asyncio.sleep(300)
-                continue
-            
-            async with BinanceIngestionService() as binance_service:
-                # Limit will be fetched from ingestion_config table
-                total_inserted = await backfill_all_symbols_timeframes(
-                    binance_service=binance_service,
-                    symbols=symbols_to_use,
-                    timeframes=timeframes,
-                    limit=None,  # Will be fetched from ingestion_config table
-                    max_retries=3
-                )
-                
-                logger.info(
-                    "gap_detection_completed",
-                    total_candles_inserted=total_inserted
-                )
-            
-            # Sleep after gap detection (check every hour)
-            await asyncio.sleep(3600)
-            
-        except asyncio.CancelledError:
-            logger.info("gap_detection_cancelled")
-            break
-        except Exception as e:
-            logger.error(
-                "gap_detection_error",
-                error=str(e),
-                exc_info=True
-            )
-            await asyncio.sleep(300)  # Wait 5 minutes before retrying
+    try:
+        logger.info("gap_detection_starting")
+        
+        # Get current symbols from symbol manager (thread-safe)
+        symbols_to_use = await symbol_manager.get_symbols()
+        
+        if not symbols_to_use:
+            logger.warning("gap_detection_no_symbols")
+            return GAP_DETECTION_RETRY_DELAY
+        
+        # Limit will be fetched from ingestion_config table
+        total_inserted = await backfill_all_symbols_timeframes(
+            binance_service=binance_service,
+            symbols=symbols_to_use,
+            timeframes=timeframes,
+            limit=None,  # Will be fetched from ingestion_config table
+            max_retries=3
+        )
+        
+        logger.info(
+            "gap_detection_completed",
+            total_candles_inserted=total_inserted
+        )
+        return None
+        
+    except asyncio.CancelledError:
+        logger.info("gap_detection_cancelled")
+        raise
+    except Exception as e:
+        logger.error(
+            "gap_detection_error",
+            error=str(e),
+            exc_info=True
+        )
+        raise  # Scheduler retries with backoff
+
+
+async def log_websocket_metrics(ws_service: BinanceWebSocketService):
+    """Scheduled job: log WebSocket throughput metrics (every 5 minutes)"""
+    metrics = ws_service.get_metrics()
+    messages_per_sec = (
+        metrics['messages_received'] / METRICS_LOG_INTERVAL 
+        if metrics['messages_received'] > 0 else 0
+    )
+    logger.info(
+        "websocket_metrics",
+        messages_received=metrics['messages_received'],
+        messages_per_second=messages_per_sec,
+        parse_errors=metrics['parse_errors'],
+        reconnect_count=metrics['reconnect_count'],
+        is_connected=metrics['is_connected']
+    )
 
 
-async def backfill_reactivated_symbols(symbols: List[str]):
-    """Backfill OHLCV data for newly reactivated symbols"""
+async def backfill_reactivated_symbols(
+    symbols: List[str],
+    binance_service: BinanceIngestionService,
+    timeframes: Optional[List[str]] = None
+):
+    """Backfill OHLCV data for newly reactivated symbols
+    
+    Callers that just loaded the ingestion timeframes pass them in; they are
+    only queried here when not supplied.
+    """
     if not symbols:
         return
     
@@ -188,23 +368,22 @@ async def backfill_reactivated_symbols(symbols: List[str]):
             symbols=symbols[:10] if len(symbols) > 10 else symbols
         )
         
-        with DatabaseManager() as db:
-            timeframes = get_ingestion_timeframes(db)
+        if not timeframes:
+            timeframes = await asyncio.to_thread(run_in_session, get_ingestion_timeframes)
         
-        async with BinanceIngestionService() as binance_service:
-            total_inserted = await backfill_all_symbols_timeframes(
-                binance_service=binance_service,
-                symbols=symbols,
-                timeframes=timeframes,
-                limit=None,  # Will be fetched from ingestion_config table
-                max_retries=3
-            )
-            
-            logger.info(
-                "reactivated_symbols_backfilled",
-                symbol_count=len(symbols),
-                total_candles_inserted=total_inserted
-            )
+        total_inserted = await backfill_all_symbols_timeframes(
+            binance_service=binance_service,
+            symbols=symbols,
+            timeframes=timeframes,
+            limit=None,  # Will be fetched from ingestion_config table
+            max_retries=3
+        )
+        
+        logger.info(
+            "reactivated_symbols_backfilled",
+            symbol_count=len(symbols),
+            total_candles_inserted=total_inserted
+        )
     except Exception as e:
         logger.error(
             "error_backfilling_reactivated_symbols",
@@ -216,7 +395,8 @@ async def backfill_reactivated_symbols(symbols: List[str]):
 async def listen_for_config_changes(
     shutdown_event: asyncio.Event,
     symbol_manager: SymbolManager,
-    ws_service_ref: list  # List to hold WebSocket service reference
+    ws_service_ref: list,  # List to hold WebSocket service reference
+    binance_service: BinanceIngestionService
 ):
     """Listen for ingestion config changes and reload qualified symbols using SymbolManager"""
     redis_client = get_redis()
@@ -248,60 +428,30 @@ async def listen_for_config_changes(
                         message=data.get("message")
                     )
                     
-                    # Reload qualified symbols with new config
-                    with DatabaseManager() as db:
-                        # Get config values
-                        from database.repository import get_ingestion_config_value
-                        min_volume = get_ingestion_config_value(db, "limit_volume_up", default_value=50000000.0)
-                        min_market_cap = get_ingestion_config_value(db, "limit_market_cap", default_value=50000000.0)
-                        min_volume = min_volume if min_volume is not None else 50000000.0
-                        min_market_cap = min_market_cap if min_market_cap is not None else 50000000.0
-                        
-                        # Get filters
-                        filter_results = get_symbol_filters(db)
-                        whitelisted_symbols = set()
-                        blacklisted_symbols = set()
-                        for filter_item in filter_results:
-                            symbol = filter_item["symbol"]
-                            filter_type = filter_item["filter_type"]
-                            if filter_type == "whitelist":
-                                whitelisted_symbols.add(symbol)
-                            elif filter_type == "blacklist":
-                                blacklisted_symbols.add(symbol)
-                        
-                        # Use SymbolLifecycleService for activation/deactivation
-                        lifecycle_service = SymbolLifecycleService()
-                        
-                        # Activate whitelisted symbols
-                        if whitelisted_symbols:
-                            await lifecycle_service.activate_symbols(db, list(whitelisted_symbols))
-                        
-                        # Deactivate blacklisted symbols
-                        if blacklisted_symbols:
-                            await lifecycle_service.deactivate_symbols(db, list(blacklisted_symbols))
-                        
-                        # Find and reactivate symbols meeting criteria
-                        reactivated_symbols = await lifecycle_service.reactivate_symbols_meeting_criteria(
-                            db, min_market_cap, min_volume, whitelisted_symbols, blacklisted_symbols
+                    # Apply the new filters and thresholds off the event loop
+                    reactivated_symbols = await asyncio.to_thread(
+                        run_in_session, reconcile_symbol_lifecycle, True
+                    )
+                    
+                    # Get qualified symbols (pure query) off the event loop
+                    new_symbols, timeframes = await asyncio.to_thread(
+                        run_in_session, get_qualified_symbols_and_timeframes
+                    )
+                    
+                    # Update symbol manager (will notify subscribers)
+                    await symbol_manager.update_symbols(new_symbols, timeframes)
+                    
+                    # Backfill reactivated symbols immediately (don't block)
+                    if reactivated_symbols:
+                        logger.info(
+                            "backfilling_reactivated_symbols",
+                            count=len(reactivated_symbols),
+                            symbols=reactivated_symbols[:10] if len(reactivated_symbols) > 10 else reactivated_symbols
+                        )
+                        spawn_background_task(
+                            backfill_reactivated_symbols(reactivated_symbols, binance_service, timeframes),
+                            name="backfill_reactivated_symbols"
                         )
-                        
-                        # Get qualified symbols (pure query)
-                        new_symbols = get_qualified_symbols(db)
-                        timeframes = get_ingestion_timeframes(db)
-                        
-                        db.commit()
-                        
-                        # Update symbol manager (will notify subscribers)
-                        await symbol_manager.update_symbols(new_symbols, timeframes)
-                        
-                        # Backfill reactivated symbols immediately (don't block)
-                        if reactivated_symbols:
-                            logger.info(
-                                "backfilling_reactivated_symbols",
-                                count=len(reactivated_symbols),
-                                symbols=reactivated_symbols[:10] if len(reactivated_symbols) > 10 else reactivated_symbols
-                            )
-                            asyncio.create_task(backfill_reactivated_symbols(reactivated_symbols))
                         
                 except json.JSONDecodeError as e:
                     logger.error(f"Error parsing config change message: {e}")
@@ -317,6 +467,20 @@ async def listen_for_config_changes(
 
 
 async def main():
+    """Process entry point: owns the HTTP session and the Binance REST service
+    
+    One BinanceIngestionService serves startup ingestion, backfills and every
+    scheduled job, so its keep-alive connections and ingest cap are shared.
+    """
+    async with create_http_session() as http_session:
+        async with BinanceIngestionService(http_session) as binance_service:
+            await run_ingestion(binance_service, http_session)
+
+
+async def run_ingestion(
+    binance_service: BinanceIngestionService,
+    http_session: aiohttp.ClientSession
+):
     """Main ingestion loop with graceful shutdown using SymbolManager"""
     setup_signal_handlers()
     
@@ -324,201 +488,180 @@ async def main():
         logger.error("database_initialization_failed")
         return
     
+    # Preload symbol/timeframe ids so the first candle writes skip the lookups
+    await asyncio.to_thread(run_in_session, warm_lookup_caches)
+    
     # Create SymbolManager (replaces global state)
     symbol_manager = SymbolManager()
     
-    # New ingestion flow: Start with Binance perpetual futures, enrich with CoinGecko
-    async with BinanceIngestionService() as binance_service:
-        async with CoinGeckoIngestionService() as coingecko_service:
-            ingestion_result = await coingecko_service.ingest_from_binance_perpetuals_and_save(
-                binance_service=binance_service
-            )
-            newly_activated = ingestion_result.get("newly_activated_symbols", []) if ingestion_result else []
-            logger.info(
-                "binance_perpetuals_ingestion_completed",
-                newly_activated=len(newly_activated),
+    # New ingestion flow: Start with Binance perpetual futures, enrich with CoinGecko.
+    # A restart while the saved market data is still fresh reuses it instead
+    # of re-downloading the market; the refresh then runs once, when the data
+    # turns PERPETUALS_REFRESH_INTERVAL old.
+    deferred_refresh_delay = None
+    market_data_age = await asyncio.to_thread(run_in_session, get_market_data_age)
+    if market_data_age is not None and market_data_age < PERPETUALS_REFRESH_INTERVAL:
+        deferred_refresh_delay = PERPETUALS_REFRESH_INTERVAL - market_data_age
+        logger.info(
+            "perpetuals_bootstrap_skipped_fresh",
+            age_seconds=market_data_age,
+            next_refresh_seconds=deferred_refresh_delay
+        )
+    else:
+        try:
+            await refresh_perpetuals(binance_service, http_session)
+        except Exception as e:
+            # Start on the symbols already in the database and retry shortly
+            deferred_refresh_delay = JOB_BACKOFF_BASE
+            logger.warning(
+                "perpetuals_bootstrap_failed",
+                error=str(e),
+                retry_in=deferred_refresh_delay
             )
-            if newly_activated:
-                logger.info(
-                    "backfilling_symbols_from_binance_ingestion",
-                    count=len(newly_activated),
-                    symbols=newly_activated[:10] if len(newly_activated) > 10 else newly_activated,
-                )
-                asyncio.create_task(backfill_reactivated_symbols(newly_activated))
     
-    # Start periodic market data update task (runs every 5 minutes, independently)
-    update_task = asyncio.create_task(periodic_market_data_update())
-    logger.info("periodic_market_data_update_task_started")
+    # Reactivate symbols meeting criteria off the event loop
+    reactivated_symbols = await asyncio.to_thread(run_in_session, reconcile_symbol_lifecycle)
     
-    try:
-        # Get qualified symbols and timeframes from database
-        with DatabaseManager() as db:
-            timeframes = get_ingestion_timeframes(db)
-            
-            # Get config values for reactivation
-            from database.repository import get_ingestion_config_value
-            min_volume = get_ingestion_config_value(db, "limit_volume_up", default_value=50000000.0)
-            min_market_cap = get_ingestion_config_value(db, "limit_market_cap", default_value=50000000.0)
-            min_volume = min_volume if min_volume is not None else 50000000.0
-            min_market_cap = min_market_cap if min_market_cap is not None else 50000000.0
-            
-            # Get filters
-            filter_results = get_symbol_filters(db)
-            whitelisted_symbols = set()
-            blacklisted_symbols = set()
-            for filter_item in filter_results:
-                symbol = filter_item["symbol"]
-                filter_type = filter_item["filter_type"]
-                if filter_type == "whitelist":
-                    whitelisted_symbols.add(symbol)
-                elif filter_type == "blacklist":
-                    blacklisted_symbols.add(symbol)
-            
-            # Use SymbolLifecycleService to reactivate symbols
-            lifecycle_service = SymbolLifecycleService()
-            reactivated_symbols = await lifecycle_service.reactivate_symbols_meeting_criteria(
-                db, min_market_cap, min_volume, whitelisted_symbols, blacklisted_symbols
-            )
-            
-            # Get qualified symbols (pure query)
-            symbols = get_qualified_symbols(db)
-            if not symbols:
-                logger.warning("no_qualified_symbols_using_defaults")
-                symbols = DEFAULT_SYMBOLS
-            
-            db.commit()
-            
-            # Backfill any reactivated symbols immediately
-            if reactivated_symbols:
+    # Get qualified symbols and timeframes (pure queries) off the event loop
+    symbols, timeframes = await asyncio.to_thread(run_in_session, get_qualified_symbols_and_timeframes)
+    if not symbols:
+        logger.warning("no_qualified_symbols_using_defaults")
+        symbols = DEFAULT_SYMBOLS
+    
+    # Backfill any reactivated symbols immediately
+    if reactivated_symbols:
+        logger.info(
+            "backfilling_initial_reactivated_symbols",
+            count=len(reactivated_symbols),
+            symbols=reactivated_symbols[:10] if len(reactivated_symbols) > 10 else reactivated_symbols
+        )
+        # Trigger backfill asynchronously (don't block startup)
+        spawn_background_task(
+            backfill_reactivated_symbols(reactivated_symbols, binance_service, timeframes),
+            name="backfill_reactivated_symbols"
+        )
+    
+    # Initialize symbol manager
+    await symbol_manager.update_symbols(symbols, timeframes)
+    
+    logger.info(
+        "websocket_ingestion_starting",
+        symbol_count=len(symbols),
+        timeframe_count=len(timeframes),
+        timeframes=timeframes
+    )
+    
+    # WebSocket service reference for config listener
+    ws_service_ref = []
+    
+    # Subscribe WebSocket to symbol updates
+    async def on_symbols_changed(new_symbols, new_timeframes, added, removed):
+        """Handle symbol updates - notify WebSocket service"""
+        if ws_service_ref and ws_service_ref[0]:
+            try:
+                await ws_service_ref[0].update_symbols(new_symbols, new_timeframes)
                 logger.info(
-                    "backfilling_initial_reactivated_symbols",
-                    count=len(reactivated_symbols),
-                    symbols=reactivated_symbols[:10] if len(reactivated_symbols) > 10 else reactivated_symbols
+                    "websocket_subscriptions_updated",
+                    symbol_count=len(new_symbols),
+                    timeframe_count=len(new_timeframes)
                 )
-                # Trigger backfill asynchronously (don't block startup)
-                asyncio.create_task(backfill_reactivated_symbols(reactivated_symbols))
-        
-        # Initialize symbol manager
-        await symbol_manager.update_symbols(symbols, timeframes)
+            except Exception as e:
+                logger.error(
+                    "error_updating_websocket_subscriptions",
+                    error=str(e),
+                    exc_info=True
+                )
+    
+    symbol_manager.subscribe(on_symbols_changed)
+    
+    # Start config change listener
+    config_listener_task = asyncio.create_task(
+        listen_for_config_changes(shutdown_event, symbol_manager, ws_service_ref, binance_service),
+        name="config_listener"
+    )
+    config_listener_task.add_done_callback(_shutdown_on_failure)
+    
+    # Start WebSocket service for real-time OHLCV data
+    async with BinanceWebSocketService(http_session) as ws_service:
+        # Store reference for config listener
+        ws_service_ref.append(ws_service)
         
-        logger.info(
-            "websocket_ingestion_starting",
-            symbol_count=len(symbols),
-            timeframe_count=len(timeframes),
-            timeframes=timeframes
+        # One scheduler drives every periodic job from a single timing loop
+        scheduler = PeriodicScheduler(shutdown_event)
+        if deferred_refresh_delay is not None:
+            scheduler.add_job(
+                "perpetuals_refresh",
+                lambda: run_deferred_perpetuals_refresh(binance_service, http_session, symbol_manager),
+                PERPETUALS_REFRESH_INTERVAL,
+                first_delay=deferred_refresh_delay,
+                repeat=False
+            )
+        scheduler.add_job(
+            "market_data_update",
+            lambda: update_market_data(binance_service, http_session),
+            MARKET_DATA_UPDATE_INTERVAL
         )
-        
-        # Start gap detection task (uses symbol_manager)
-        gap_task = asyncio.create_task(gap_detection_task(symbol_manager, timeframes))
-        
-        # WebSocket service reference for config listener
-        ws_service_ref = []
-        
-        # Subscribe WebSocket to symbol updates
-        async def on_symbols_changed(new_symbols, new_timeframes, added, removed):
-            """Handle symbol updates - notify WebSocket service"""
-            if ws_service_ref and ws_service_ref[0]:
-                try:
-                    await ws_service_ref[0].update_symbols(new_symbols, new_timeframes)
-                    logger.info(
-                        "websocket_subscriptions_updated",
-                        symbol_count=len(new_symbols),
-                        timeframe_count=len(new_timeframes)
-                    )
-                except Exception as e:
-                    logger.error(
-                        "error_updating_websocket_subscriptions",
-                        error=str(e),
-                        exc_info=True
-                    )
-        
-        symbol_manager.subscribe(on_symbols_changed)
-        
-        # Start config change listener
-        config_listener_task = asyncio.create_task(
-            listen_for_config_changes(shutdown_event, symbol_manager, ws_service_ref)
+        scheduler.add_job(
+            "gap_detection",
+            lambda: run_gap_detection(symbol_manager, timeframes, binance_service),
+            GAP_DETECTION_INTERVAL,
+            first_delay=0
         )
+        scheduler.add_job(
+            "websocket_metrics",
+            lambda: log_websocket_metrics(ws_service),
+            METRICS_LOG_INTERVAL
+        )
+        scheduler_task = asyncio.create_task(scheduler.run(), name="scheduler")
+        # A dead scheduler would silently stop every periodic job; stop the
+        # process instead so the container is restarted
+        scheduler_task.add_done_callback(_shutdown_on_failure)
         
-        # Start WebSocket service for real-time OHLCV data
-        async with BinanceWebSocketService() as ws_service:
-            # Store reference for config listener
-            ws_service_ref.append(ws_service)
-            
-            # Start periodic metrics logging task
-            async def log_metrics_periodically():
-                while not shutdown_event.is_set():
-                    try:
-                        await asyncio.sleep(300)  # Log every 5 minutes
-                        
-                        if shutdown_event.is_set():
-                            break
-                        
-                        metrics = ws_service.get_metrics()
-                        messages_per_sec = (
-                            metrics['messages_received'] / 300 
-                            if metrics['messages_received'] > 0 else 0
-                        )
-                        logger.info(
-                            "websocket_metrics",
-                            messages_received=metrics['messages_received'],
-                            messages_per_second=messages_per_sec,
-                            parse_errors=metrics['parse_errors'],
-                            reconnect_count=metrics['reconnect_count'],
-                            is_connected=metrics['is_connected']
-                        )
-                    except asyncio.CancelledError:
-                        break
+        try:
+            # Start WebSocket service (runs indefinitely with reconnection)
+            await ws_service.start(symbols, timeframes, shutdown_event=shutdown_event)
+        finally:
+            # Graceful shutdown: cancel tasks and flush pending data
+            logger.info("shutdown_initiated")
             
-            metrics_task = asyncio.create_task(log_metrics_periodically())
+            # Stop the scheduler: it lets in-flight periodic jobs finish
+            # (bounded by its drain timeout) instead of cancelling mid-write
+            shutdown_event.set()
+            try:
+                await scheduler_task
+            except Exception:
+                pass  # Already logged by _shutdown_on_failure
             
+            # The config listener polls shutdown_event every second; give it a
+            # moment to finish an in-progress reload before forcing it
             try:
-                # Start WebSocket service (runs indefinitely with reconnection)
-                await ws_service.start(symbols, timeframes, shutdown_event=shutdown_event)
-            finally:
-                # Graceful shutdown: cancel tasks and flush pending data
-                logger.info("shutdown_initiated")
-                
-                # Cancel metrics task
-                metrics_task.cancel()
-                try:
-                    await metrics_task
-                except asyncio.CancelledError:
-                    pass
-                
-                # Cancel gap detection task
-                gap_task.cancel()
+                await asyncio.wait_for(config_listener_task, timeout=CONFIG_LISTENER_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("config_listener_stop_timeout")
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass  # Already logged by _shutdown_on_failure
+            
+            # Flush any pending batches in WebSocket service (flush_batch takes
+            # _batch_lock itself; asyncio.Lock is not reentrant)
+            if ws_service.batch_buffer:
+                logger.info("flushing_pending_batches", count=len(ws_service.batch_buffer))
                 try:
-                    await gap_task
-                except asyncio.CancelledError:
-                    pass
-                
-                # Cancel config listener task
-                config_listener_task.cancel()
-                try:    
-                    await config_listener_task
-                except asyncio.CancelledError:
-                    pass
-                
-                # Flush any pending batches in WebSocket service
-                async with ws_service._batch_lock:
-                    if ws_service.batch_buffer:
-                        logger.info("flushing_pending_batches", count=len(ws_service.batch_buffer))
-                        try:
-                            await ws_service.flush_batch()
-                        except Exception as e:
-                            logger.error("error_flushing_final_batch", error=str(e))
-                
-                logger.info("shutdown_completed")
-
-    finally:
-        # Cancel the hourly update task
-        update_task.cancel()
-        try:
-            await update_task
-        except asyncio.CancelledError:
-            pass
+                    await ws_service.flush_batch()
+                except Exception as e:
+                    logger.error("error_flushing_final_batch", error=str(e))
+            
+            logger.info("shutdown_completed")
 
 
 if __name__ == "__main__":
+    # libuv-backed loop for the socket-heavy REST + WebSocket workload; the
+    # stdlib loop remains the fallback where uvloop is unavailable (Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
 
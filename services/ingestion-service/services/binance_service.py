@@ -5,33 +5,58 @@ import sys
 import os
 import asyncio
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Set
-from dataclasses import dataclass
-from decimal import Decimal
+from operator import itemgetter
+from typing import List, Dict, NamedTuple, Optional, Set
 import aiohttp
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 import structlog
 
 # Add shared to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 
 from shared.database import DatabaseManager
-from shared.redis_client import publish_event
+from shared.redis_client import publish_event, publish_events, cache_get, cache_set
 
 # Import from local modules (relative to ingestion-service root)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from utils.circuit_breaker import AsyncCircuitBreaker
-from utils.rate_limiter import BINANCE_RATE_LIMIT, BINANCE_BURST_LIMIT
+from utils.http_client import create_http_session
+from utils.rate_limiter import (
+    BINANCE_RATE_LIMIT,
+    BINANCE_BURST_LIMIT,
+    BINANCE_WEIGHT_TRACKER,
+    binance_klines_weight,
+    retry_after_seconds
+)
 from config.settings import BINANCE_API_URL, DEFAULT_TIMEFRAME, SYMBOL_LIMIT
-from database.repository import get_or_create_symbol_record, get_timeframe_id
+from database.repository import (
+    get_or_create_symbol_record,
+    get_timeframe_id,
+    bulk_execute_values,
+    copy_candles,
+    use_async_commit,
+    CANDLE_COPY_MIN_ROWS
+)
 
 logger = structlog.get_logger(__name__)
 
+MAX_CONCURRENT_INGESTS = 32  # In-flight symbol kline fetches per service instance
+PERPETUAL_SYMBOLS_CACHE_KEY = "binance:perpetual_symbols"
+PERPETUAL_SYMBOLS_CACHE_TTL = 3600  # Seconds
+BINANCE_MAX_RETRIES = 4  # Retries of a request rejected with 429/418
+# Request weights of the fixed-cost endpoints (klines depends on limit)
+TICKER_24H_WEIGHT = 1  # /fapi/v1/ticker/24hr for one symbol
+ALL_TICKERS_24H_WEIGHT = 40  # /fapi/v1/ticker/24hr without a symbol
+EXCHANGE_INFO_WEIGHT = 1
 
-@dataclass
-class CandleData:
-    """Simple data structure for OHLCV candle data (not an ORM object)"""
+
+class CandleData(NamedTuple):
+    """Simple data structure for OHLCV candle data (not an ORM object)
+    
+    A NamedTuple so parsing builds plain tuples and save_candles can slice the
+    OHLCV fields straight into insert rows.
+    """
     symbol: str
     timeframe: str
     timestamp: datetime
@@ -45,9 +70,13 @@ class CandleData:
 class BinanceIngestionService:
     """Service for ingesting data from Binance Futures/Perpetual API (fapi/v1)"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = BINANCE_API_URL  # Should be https://fapi.binance.com for perpetual futures
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None  # Shared sessions are closed by their creator
+        # Caps concurrent symbol kline fetches so a 200+ symbol gather stays
+        # within the connector's per-host limit and Binance's weight budget
+        self._ingest_semaphore = asyncio.Semaphore(MAX_CONCURRENT_INGESTS)
         self.circuit_breaker = AsyncCircuitBreaker(
             failure_threshold=5,
             recovery_timeout=60,
@@ -55,12 +84,52 @@ class BinanceIngestionService:
         )
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = create_http_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+    
+    async def _get_json(self, url: str, params: Optional[Dict] = None, timeout: int = 30, weight: int = 1):
+        """GET a Binance endpoint under the rate limiters and return parsed JSON
+        
+        429/418 responses are retried after Retry-After (or exponential backoff),
+        and each attempt reserves its request weight so requests pause before
+        the minute cap is hit.
+        Any other non-200 status, or a 429/418 on the last attempt, raises
+        aiohttp.ClientResponseError; the parsed body is always returned otherwise.
+        """
+        for attempt in range(BINANCE_MAX_RETRIES + 1):
+            await BINANCE_WEIGHT_TRACKER.acquire(weight)
+            async with BINANCE_RATE_LIMIT:
+                async with BINANCE_BURST_LIMIT:
+                    async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        BINANCE_WEIGHT_TRACKER.record(response.headers)
+                        if response.status == 200:
+                            return await response.json(loads=orjson.loads)
+                        if response.status not in (418, 429) or attempt == BINANCE_MAX_RETRIES:
+                            response.raise_for_status()
+                            # Non-error statuses other than 200 (e.g. 204) carry no payload
+                            raise aiohttp.ClientResponseError(
+                                response.request_info,
+                                response.history,
+                                status=response.status,
+                                message="unexpected status",
+                                headers=response.headers
+                            )
+                        delay = retry_after_seconds(response.headers, 2 ** attempt)
+                        status = response.status
+            logger.warning(
+                "binance_rate_limited",
+                url=url,
+                status_code=status,
+                attempt=attempt + 1,
+                retry_in_seconds=delay
+            )
+            await asyncio.sleep(delay)
     
     async def _fetch_klines_impl(
         self, 
@@ -93,29 +162,24 @@ class BinanceIngestionService:
         if end_time:
             params["endTime"] = int(end_time.timestamp() * 1000)
         
-        # Apply rate limiting
-        async with BINANCE_RATE_LIMIT:
-            async with BINANCE_BURST_LIMIT:
-                async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(
-                            "klines_fetched",
-                            symbol=symbol,
-                            interval=interval,
-                            count=len(data),
-                            limit=limit
-                        )
-                        return data
-                    else:
-                        logger.error(
-                            "klines_fetch_failed",
-                            symbol=symbol,
-                            interval=interval,
-                            status_code=response.status
-                        )
-                        response.raise_for_status()
-                        return []
+        try:
+            data = await self._get_json(url, params=params, timeout=30, weight=binance_klines_weight(limit))
+        except aiohttp.ClientResponseError as e:
+            logger.error(
+                "klines_fetch_failed",
+                symbol=symbol,
+                interval=interval,
+                status_code=e.status
+            )
+            raise
+        logger.info(
+            "klines_fetched",
+            symbol=symbol,
+            interval=interval,
+            count=len(data),
+            limit=limit
+        )
+        return data
     
     async def fetch_klines(
         self, 
@@ -167,14 +231,7 @@ class BinanceIngestionService:
         """Internal implementation of fetch_ticker_24h with rate limiting"""
         url = f"{self.base_url}/fapi/v1/ticker/24hr"
         params = {"symbol": symbol}
-        
-        async with BINANCE_RATE_LIMIT:
-            async with BINANCE_BURST_LIMIT:
-                async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    response.raise_for_status()
-                    return None
+        return await self._get_json(url, params=params, timeout=30, weight=TICKER_24H_WEIGHT)
     
     async def fetch_ticker_24h(self, symbol: str) -> Optional[Dict]:
         """Fetch 24h ticker data for a single symbol with circuit breaker protection"""
@@ -193,26 +250,23 @@ class BinanceIngestionService:
         """Internal implementation of fetch_all_tickers_24h with rate limiting"""
         url = f"{self.base_url}/fapi/v1/ticker/24hr"
         # No symbol parameter = get all tickers
+        try:
+            tickers = await self._get_json(url, timeout=60, weight=ALL_TICKERS_24H_WEIGHT)
+        except aiohttp.ClientResponseError as e:
+            logger.error(
+                "all_tickers_fetch_failed",
+                status_code=e.status
+            )
+            raise
         
-        async with BINANCE_RATE_LIMIT:
-            async with BINANCE_BURST_LIMIT:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status == 200:
-                        tickers = await response.json()
-                        # Convert list to dictionary keyed by symbol for fast lookup
-                        ticker_dict = {ticker.get("symbol"): ticker for ticker in tickers if ticker.get("symbol")}
-                        logger.info(
-                            "all_tickers_fetched",
-                            count=len(ticker_dict)
-                        )
-                        return ticker_dict
-                    else:
-                        logger.error(
-                            "all_tickers_fetch_failed",
-                            status_code=response.status
-                        )
-                        response.raise_for_status()
-                        return {}
+        # Convert list to dictionary keyed by symbol for fast lookup
+        symbol_of = itemgetter("symbol")
+        ticker_dict = {symbol_of(ticker): ticker for ticker in tickers if "symbol" in ticker}
+        logger.info(
+            "all_tickers_fetched",
+            count=len(ticker_dict)
+        )
+        return ticker_dict
     
     async def fetch_all_tickers_24h(self) -> Dict[str, Dict]:
         """Fetch 24h ticker data for all symbols with circuit breaker protection"""
@@ -229,13 +283,7 @@ class BinanceIngestionService:
     async def _fetch_exchange_info_impl(self) -> Optional[Dict]:
         """Internal implementation of fetch_exchange_info with rate limiting"""
         url = f"{self.base_url}/fapi/v1/exchangeInfo"
-        async with BINANCE_RATE_LIMIT:
-            async with BINANCE_BURST_LIMIT:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    response.raise_for_status()
-                    return None
+        return await self._get_json(url, timeout=30, weight=EXCHANGE_INFO_WEIGHT)
     
     async def fetch_exchange_info(self) -> Optional[Dict]:
         """Fetch exchange information with circuit breaker protection"""
@@ -250,7 +298,11 @@ class BinanceIngestionService:
             return None
     
     async def get_available_perpetual_symbols(self) -> Set[str]:
-        """Get set of available perpetual contract symbols from Binance Futures"""
+        """Get set of available perpetual contract symbols from Binance Futures (cached)"""
+        cached = cache_get(PERPETUAL_SYMBOLS_CACHE_KEY)
+        if cached:
+            return set(orjson.loads(cached))
+        
         try:
             exchange_info = await self.fetch_exchange_info()
             if not exchange_info:
@@ -267,6 +319,14 @@ class BinanceIngestionService:
                 "perpetual_symbols_found",
                 count=len(perpetual_symbols)
             )
+            
+            # Listings change on the order of days; cache for an hour
+            if perpetual_symbols:
+                cache_set(
+                    PERPETUAL_SYMBOLS_CACHE_KEY,
+                    orjson.dumps(sorted(perpetual_symbols)),
+                    ttl=PERPETUAL_SYMBOLS_CACHE_TTL
+                )
             return perpetual_symbols
         except Exception as e:
             logger.error(
@@ -278,20 +338,27 @@ class BinanceIngestionService:
     
     def parse_klines(self, klines: List[List], symbol: str, timeframe: str) -> List[CandleData]:
         """Parse klines data into CandleData objects (simple data structures, not ORM objects)"""
+        fromtimestamp = datetime.fromtimestamp
+        utc = timezone.utc
+        try:
+            return [
+                CandleData(
+                    symbol, timeframe, fromtimestamp(k[0] / 1000, tz=utc),
+                    float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5])
+                )
+                for k in klines
+            ]
+        except (ValueError, TypeError, IndexError):
+            # Rare malformed row: redo the slow way so only bad rows are dropped
+            pass
+        
         candles = []
         for kline in klines:
             try:
-                candle = CandleData(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    timestamp=datetime.fromtimestamp(kline[0] / 1000, tz=timezone.utc),
-                    open=float(kline[1]),
-                    high=float(kline[2]),
-                    low=float(kline[3]),
-                    close=float(kline[4]),
-                    volume=float(kline[5])
-                )
-                candles.append(candle)
+                candles.append(CandleData(
+                    symbol, timeframe, fromtimestamp(kline[0] / 1000, tz=utc),
+                    float(kline[1]), float(kline[2]), float(kline[3]), float(kline[4]), float(kline[5])
+                ))
             except Exception as e:
                 logger.error(
                     "kline_parse_error",
@@ -299,7 +366,6 @@ class BinanceIngestionService:
                     error=str(e),
                     exc_info=True
                 )
-                continue
         return candles
     
     def save_candles(self, db: Session, candles: List[CandleData]):
@@ -325,29 +391,28 @@ class BinanceIngestionService:
                 )
                 return
             
-            # Batch insert all candles in single execute
-            params_list = []
-            for candle in candles:
-                params_list.append({
-                    "symbol_id": symbol_id,
-                    "timeframe_id": timeframe_id,
-                    "timestamp": candle.timestamp,
-                    "open": Decimal(str(candle.open)),
-                    "high": Decimal(str(candle.high)),
-                    "low": Decimal(str(candle.low)),
-                    "close": Decimal(str(candle.close)),
-                    "volume": Decimal(str(candle.volume))
-                })
-            
-            stmt = text("""
-                INSERT INTO ohlcv_candles 
-                (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
-                VALUES (:symbol_id, :timeframe_id, :timestamp, :open, :high, :low, :close, :volume)
-                ON CONFLICT (symbol_id, timeframe_id, timestamp) DO NOTHING
-            """)
+            use_async_commit(db)  # Candles can be re-fetched from Binance
             
-            # Single execute for all candles (more efficient)
-            db.execute(stmt, params_list)
+            # psycopg2 renders floats as numeric literals, so no Decimal round-trip is needed
+            # candle[2:] is (timestamp, open, high, low, close, volume)
+            id_prefix = (symbol_id, timeframe_id)
+            rows = [id_prefix + candle[2:] for candle in candles]
+
+            if len(rows) >= CANDLE_COPY_MIN_ROWS:
+                # Large backfills: COPY into staging, then merge
+                copy_candles(db, rows)
+            else:
+                # One multi-row INSERT per 1000 candles instead of one statement per candle
+                bulk_execute_values(
+                    db,
+                    """
+                    INSERT INTO ohlcv_candles
+                    (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
+                    VALUES %s
+                    ON CONFLICT (symbol_id, timeframe_id, timestamp) DO NOTHING
+                    """,
+                    rows
+                )
             
             # Note: No commit here - caller commits at service boundary
             logger.info(
@@ -367,36 +432,49 @@ class BinanceIngestionService:
             )
             raise
     
-    async def ingest_symbol(self, symbol: str, timeframe: str = DEFAULT_TIMEFRAME):
-        """Ingest data for a single symbol with error isolation"""
-        try:
+    def _candle_update_event(self, candle: CandleData) -> Dict:
+        """Build the candle_update event payload with full OHLCV data"""
+        return {
+            "symbol": candle.symbol,
+            "timeframe": candle.timeframe,
+            "timestamp": candle.timestamp.isoformat(),
+            "open": float(candle.open),
+            "high": float(candle.high),
+            "low": float(candle.low),
+            "close": float(candle.close),
+            "volume": float(candle.volume),
+            "closed": True
+        }
+    
+    async def _fetch_symbol_candles(
+        self,
+        symbol: str,
+        timeframe: str = DEFAULT_TIMEFRAME
+    ) -> Optional[List[CandleData]]:
+        """Fetch and parse the latest klines for one symbol (None if nothing usable)"""
+        async with self._ingest_semaphore:
             logger.debug("ingestion_started", symbol=symbol, timeframe=timeframe)
             
             # Fetch klines
             klines = await self.fetch_klines(symbol, timeframe, limit=SYMBOL_LIMIT)
             if not klines:
                 logger.warning("no_klines_fetched", symbol=symbol, timeframe=timeframe)
+                return None
+            
+            # Parse
+            return self.parse_klines(klines, symbol, timeframe) or None
+    
+    async def ingest_symbol(self, symbol: str, timeframe: str = DEFAULT_TIMEFRAME):
+        """Ingest data for a single symbol with error isolation"""
+        try:
+            candles = await self._fetch_symbol_candles(symbol, timeframe)
+            if not candles:
                 return
             
-            # Parse and save
-            candles = self.parse_klines(klines, symbol, timeframe)
-            if candles:
-                with DatabaseManager() as db:
-                    self.save_candles(db, candles)
-                    db.commit()  # Commit at service boundary
-                    # Publish event with full OHLCV data
-                    latest_candle = candles[-1]
-                    publish_event("candle_update", {
-                        "symbol": symbol,
-                        "timeframe": timeframe,
-                        "timestamp": latest_candle.timestamp.isoformat(),
-                        "open": float(latest_candle.open),
-                        "high": float(latest_candle.high),
-                        "low": float(latest_candle.low),
-                        "close": float(latest_candle.close),
-                        "volume": float(latest_candle.volume),
-                        "closed": True
-                    })
+            with DatabaseManager() as db:
+                self.save_candles(db, candles)
+                db.commit()  # Commit at service boundary
+            publish_event("candle_update", self._candle_update_event(candles[-1]))
             
             # Note: market_data (price, market_cap, volume_24h) is updated hourly 
             # via the CoinGecko hourly update task, not here
@@ -410,15 +488,78 @@ class BinanceIngestionService:
                 exc_info=True
             )
     
+    def _save_candle_batches(self, candle_batches: List[List[CandleData]], timeframe: str) -> List[CandleData]:
+        """Save each symbol's candles in its own SAVEPOINT and commit once (blocking)
+        
+        Returns:
+            The latest candle of every symbol that was saved, for publishing
+        """
+        saved = []
+        with DatabaseManager() as db:
+            for candles in candle_batches:
+                try:
+                    # A failing symbol only rolls back its own savepoint
+                    with db.begin_nested():
+                        self.save_candles(db, candles)
+                    saved.append(candles[-1])
+                except Exception as e:
+                    logger.error(
+                        "ingestion_error",
+                        symbol=candles[0].symbol,
+                        timeframe=timeframe,
+                        error=str(e),
+                        exc_info=True
+                    )
+            db.commit()  # Single commit for the whole batch
+        return saved
+    
     async def ingest_all_symbols(self, symbols: List[str], timeframe: str = DEFAULT_TIMEFRAME):
-        """Ingest data for multiple symbols with error isolation"""
-        tasks = [self.ingest_symbol(symbol, timeframe) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """Ingest data for multiple symbols with error isolation
+        
+        Klines are fetched first; only then is one session opened, so no
+        connection sits idle in a transaction during the rate-limited HTTP
+        fetches. All symbols are written in one transaction with a savepoint
+        each and committed together.
+        """
+        results = await asyncio.gather(
+            *(self._fetch_symbol_candles(symbol, timeframe) for symbol in symbols),
+            return_exceptions=True
+        )
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                # Isolate errors per symbol - log but don't abort the batch
+                logger.error(
+                    "ingestion_error",
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    error=str(result),
+                    exc_info=result
+                )
+        
+        candle_batches = [result for result in results if result and not isinstance(result, Exception)]
+        try:
+            saved_candles = await asyncio.to_thread(self._save_candle_batches, candle_batches, timeframe)
+        except Exception as e:
+            logger.error(
+                "ingestion_batch_commit_error",
+                timeframe=timeframe,
+                symbol_count=len(symbols),
+                error=str(e),
+                exc_info=True
+            )
+            return
         
-        # Count successes and failures
-        # Exceptions are caught and logged in ingest_symbol, but we can still track them here
-        success_count = sum(1 for r in results if r is None or not isinstance(r, Exception))
-        failure_count = sum(1 for r in results if isinstance(r, Exception))
+        # Publish only after the candles are committed, pipelined in one round-trip
+        publish_events("candle_update", [
+            self._candle_update_event(candle) for candle in saved_candles
+        ])
+        
+        # Failures: fetches that raised plus symbols whose savepoint rolled back
+        failure_count = (
+            sum(1 for r in results if isinstance(r, Exception))
+            + len(candle_batches) - len(saved_candles)
+        )
+        success_count = len(symbols) - failure_count
         
         if failure_count > 0:
             logger.warning(
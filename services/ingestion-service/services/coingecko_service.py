@@ -4,10 +4,12 @@ CoinGecko ingestion service for fetching market data from CoinGecko API
 import sys
 import os
 import asyncio
+import hashlib
 import json
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 import aiohttp
+import orjson
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import structlog
@@ -16,19 +18,24 @@ import structlog
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 
 from shared.database import DatabaseManager
-from shared.redis_client import publish_event
+from shared.redis_client import publish_event, publish_events, cache_get, cache_set
 
 # Import from local modules (relative to ingestion-service root)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from utils.circuit_breaker import AsyncCircuitBreaker
-from utils.rate_limiter import COINGECKO_RATE_LIMIT, COINGECKO_MINUTE_LIMIT
+from utils.http_client import create_http_session
+from utils.rate_limiter import COINGECKO_RATE_LIMIT, COINGECKO_MINUTE_LIMIT, retry_after_seconds
 from config.settings import COINGECKO_API_URL, COINGECKO_MIN_MARKET_CAP, COINGECKO_MIN_VOLUME_24H
 from database.repository import (
     get_or_create_symbol_record, 
+    get_or_create_symbol_records,
+    get_symbol_ids,
     get_ingestion_config_value, 
     split_symbol_components,
     should_ingest_symbol,
-    normalize_symbol
+    normalize_symbol,
+    bulk_execute_values,
+    use_async_commit
 )
 from services.binance_service import BinanceIngestionService
 
@@ -38,13 +45,22 @@ logger = structlog.get_logger(__name__)
 MAPPING_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'ticker_to_coingecko_mapping.json')
 # Path to local blacklist file
 BLACKLIST_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'coingecko_blacklist.json')
+# Concurrent /coins/markets page requests per service instance
+COINGECKO_PAGE_CONCURRENCY = 4
+# 429 handling: retry with exponential backoff starting at this many seconds
+COINGECKO_MAX_RETRIES = 3
+COINGECKO_BACKOFF_BASE = 5
+# /coins/markets pages barely change between close-in-time calls
+COINGECKO_MARKETS_CACHE_PREFIX = "coingecko:markets:"
+COINGECKO_MARKETS_CACHE_TTL = 45  # Seconds
 
 class CoinGeckoIngestionService:
     """Service for ingesting market data from CoinGecko API"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = COINGECKO_API_URL
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None  # Shared sessions are closed by their creator
         self.circuit_breaker = AsyncCircuitBreaker(
             failure_threshold=5,
             recovery_timeout=60,
@@ -52,14 +68,61 @@ class CoinGeckoIngestionService:
         )
         self._mapping_cache: Optional[Dict[str, str]] = None
         self._blacklist_cache: Optional[Set[str]] = None
+        # Pages are fetched concurrently; keep a few in flight for the free tier
+        self._page_semaphore = asyncio.Semaphore(COINGECKO_PAGE_CONCURRENCY)
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = create_http_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+    
+    async def _fetch_markets_page(self, params: Dict) -> List[Dict]:
+        """Fetch one /coins/markets page, honoring Retry-After or backing off exponentially on 429
+        
+        Pages are cached in Redis for COINGECKO_MARKETS_CACHE_TTL seconds, keyed
+        by the request params, so repeated calls skip the HTTP round trip.
+        """
+        cache_key = COINGECKO_MARKETS_CACHE_PREFIX + hashlib.sha1(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        cached = cache_get(cache_key)
+        if cached:
+            return orjson.loads(cached)
+        
+        page = await self._fetch_markets_page_uncached(params)
+        if page:
+            cache_set(cache_key, orjson.dumps(page), ttl=COINGECKO_MARKETS_CACHE_TTL)
+        return page
+    
+    async def _fetch_markets_page_uncached(self, params: Dict) -> List[Dict]:
+        url = f"{self.base_url}/coins/markets"
+        async with self._page_semaphore:
+            for attempt in range(COINGECKO_MAX_RETRIES + 1):
+                async with COINGECKO_RATE_LIMIT:
+                    async with COINGECKO_MINUTE_LIMIT:
+                        async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=60)) as response:
+                            if response.status == 200:
+                                return await response.json(loads=orjson.loads)
+                            logger.error(f"Failed to fetch CoinGecko data: {response.status}")
+                            if response.status != 429 or attempt == COINGECKO_MAX_RETRIES:
+                                response.raise_for_status()
+                            delay = retry_after_seconds(
+                                response.headers, COINGECKO_BACKOFF_BASE * (2 ** attempt)
+                            )
+                # Sleep outside the limiter context so other pages keep their slots
+                logger.warning(f"Rate limited by CoinGecko, retrying in {delay} seconds...")
+                await asyncio.sleep(delay)
+        return []
+    
+    async def _fetch_markets_pages(self, params_list: List[Dict]) -> List[Dict]:
+        """Fetch independent /coins/markets pages concurrently, preserving page order"""
+        pages = await asyncio.gather(*(self._fetch_markets_page(params) for params in params_list))
+        return [coin for page in pages for coin in page]
     
     async def _fetch_top_market_metrics_impl(self, limit: int = 200) -> List[Dict]:
         """Internal implementation of fetch_top_market_metrics"""
@@ -67,32 +130,17 @@ class CoinGeckoIngestionService:
         per_page = min(limit, 250)
         pages_needed = (limit + per_page - 1) // per_page
         
-        all_coins = []
-        for page in range(1, pages_needed + 1):
-            url = f"{self.base_url}/coins/markets"
-            params = {
+        all_coins = await self._fetch_markets_pages([
+            {
                 "vs_currency": "usd",
                 "order": "market_cap_desc",
                 "per_page": per_page,
                 "page": page,
                 "sparkline": "false"
             }
-            
-            async with COINGECKO_RATE_LIMIT:
-                async with COINGECKO_MINUTE_LIMIT:
-                    async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            all_coins.extend(data)
-                            logger.info(f"Fetched page {page}: {len(data)} coins")
-                        else:
-                            logger.error(f"Failed to fetch CoinGecko data: {response.status}")
-                            if response.status == 429:
-                                logger.warning("Rate limited by CoinGecko, waiting 60 seconds...")
-                                await asyncio.sleep(60)
-                                continue
-                            response.raise_for_status()
-                            break
+            for page in range(1, pages_needed + 1)
+        ])
+        logger.info(f"Fetched {pages_needed} pages: {len(all_coins)} coins")
         
         # Limit to requested number
         return all_coins[:limit]
@@ -132,7 +180,7 @@ class CoinGeckoIngestionService:
             logger.error(f"Error getting symbol_id for {symbol}: {e}")
             return None
     
-    async def save_market_metrics(
+    def save_market_metrics(
         self, 
         db: Session, 
         coins_data: List[Dict], 
@@ -141,41 +189,50 @@ class CoinGeckoIngestionService:
     ):
         """Save market metrics to database using CoinGecko data
         
+        Blocking; async callers run it via asyncio.to_thread.
+        
         Args:
             create_symbols: If True, creates new symbols if they don't exist.
                            If False, only updates existing symbols (skips new ones).
         """
         try:
+            use_async_commit(db)  # Metrics are refreshed from CoinGecko every cycle
             saved_count = 0
             skipped_count = 0
             current_timestamp = datetime.now()
+            market_rows: Dict[int, tuple] = {}
+            market_symbols: Dict[int, str] = {}
             
+            # Resolve each coin's symbol first so ids can be looked up in one batch
+            coin_symbols = []
+            symbol_images: Dict[str, Optional[str]] = {}
             for coin in coins_data:
+                # Use Binance symbol if available (from new ingestion flow), otherwise map from coin data
+                symbol = coin.get("_binance_symbol")
+                if not symbol:
+                    symbol = self.map_coin_to_symbol(coin)
+                if not symbol:
+                    skipped_count += 1
+                    continue
+                coin_symbols.append((coin, symbol))
+                # Extract image path from CoinGecko data
+                if symbol_images.get(symbol) is None:
+                    symbol_images[symbol] = coin.get("image")
+            
+            # Get symbol_ids - create if allowed, otherwise only existing symbols
+            if create_symbols:
+                symbol_ids = get_or_create_symbol_records(db, symbol_images)
+            else:
+                symbol_ids = get_symbol_ids(db, list(symbol_images))
+            
+            for coin, symbol in coin_symbols:
                 try:
-                    # Use Binance symbol if available (from new ingestion flow), otherwise map from coin data
-                    symbol = coin.get("_binance_symbol")
-                    if not symbol:
-                        symbol = self.map_coin_to_symbol(coin)
-                    if not symbol:
-                        skipped_count += 1
-                        continue
-                    
-                    # Extract image path from CoinGecko data
-                    image_path = coin.get("image")
-                    
-                    # Get symbol_id - create if allowed, otherwise only get existing
-                    if create_symbols:
-                        symbol_id = self.get_or_create_symbol_id(db, symbol, image_path=image_path)
-                        if not symbol_id:
+                    symbol_id = symbol_ids.get(symbol)
+                    if not symbol_id:
+                        if create_symbols:
                             logger.warning(f"Could not get/create symbol_id for {symbol}")
-                            skipped_count += 1
-                            continue
-                    else:
-                        # Only update existing symbols, skip new ones
-                        symbol_id = self.get_symbol_id(db, symbol)
-                        if not symbol_id:
-                            skipped_count += 1
-                            continue  # Skip symbols that don't exist
+                        skipped_count += 1
+                        continue  # Skip symbols that don't exist
                     
                     # Extract market data from CoinGecko
                     market_cap = coin.get("market_cap")
@@ -188,48 +245,61 @@ class CoinGeckoIngestionService:
                         skipped_count += 1
                         continue
                     
-                    # Use INSERT ... ON CONFLICT DO UPDATE for upsert
-                    stmt = text("""
-                        INSERT INTO market_data 
-                        (symbol_id, timestamp, market_cap, volume_24h, circulating_supply, price)
-                        VALUES (:symbol_id, :timestamp, :market_cap, :volume_24h, :circulating_supply, :price)
-                        ON CONFLICT (symbol_id, timestamp) 
-                        DO UPDATE SET
-                            market_cap = EXCLUDED.market_cap,
-                            volume_24h = EXCLUDED.volume_24h,
-                            circulating_supply = EXCLUDED.circulating_supply,
-                            price = EXCLUDED.price
-                    """)
-                    db.execute(stmt, {
-                        "symbol_id": symbol_id,
-                        "timestamp": current_timestamp,
-                        "market_cap": float(market_cap) if market_cap else None,
-                        "volume_24h": float(volume_24h) if volume_24h else None,
-                        "circulating_supply": float(circulating_supply) if circulating_supply else None,
-                        "price": float(price) if price else None
-                    })
-                    saved_count += 1
-                    
-                    # Publish marketcap_update event for real-time market cap and volume updates
-                    try:
-                        publish_event("marketcap_update", {
-                            "symbol": symbol,
-                            "marketcap": float(market_cap) if market_cap else None,
-                            "volume_24h": float(volume_24h) if volume_24h else None,
-                            "timestamp": current_timestamp.isoformat()
-                        })
-                    except Exception as e:
-                        logger.debug(f"Failed to publish marketcap_update event for {symbol}: {e}")
+                    # Keyed by symbol_id: one upsert statement cannot touch the same row twice
+                    market_rows[symbol_id] = (
+                        symbol_id,
+                        current_timestamp,
+                        float(market_cap) if market_cap else None,
+                        float(volume_24h) if volume_24h else None,
+                        float(circulating_supply) if circulating_supply else None,
+                        float(price) if price else None
+                    )
+                    market_symbols[symbol_id] = symbol
                     
                 except Exception as e:
                     logger.error(f"Error saving market data for {coin.get('id', 'unknown')}: {e}")
                     skipped_count += 1
                     continue
             
+            # Single multi-row upsert for all symbols instead of one statement per coin
+            bulk_execute_values(
+                db,
+                """
+                INSERT INTO market_data
+                (symbol_id, timestamp, market_cap, volume_24h, circulating_supply, price)
+                VALUES %s
+                ON CONFLICT (symbol_id, timestamp)
+                DO UPDATE SET
+                    market_cap = EXCLUDED.market_cap,
+                    volume_24h = EXCLUDED.volume_24h,
+                    circulating_supply = EXCLUDED.circulating_supply,
+                    price = EXCLUDED.price
+                WHERE (market_data.market_cap, market_data.volume_24h,
+                       market_data.circulating_supply, market_data.price)
+                    IS DISTINCT FROM
+                      (EXCLUDED.market_cap, EXCLUDED.volume_24h,
+                       EXCLUDED.circulating_supply, EXCLUDED.price)
+                """,
+                list(market_rows.values()),
+                page_size=500
+            )
+            saved_count = len(market_rows)
+            
             # Commit at service boundary (single commit for all symbols)
             db.commit()
             logger.info(f"Saved {saved_count} market metrics, skipped {skipped_count}")
             
+            # Publish marketcap_update events for real-time market cap and volume updates
+            publish_events("marketcap_update", [
+                {
+                    "symbol": market_symbols[symbol_id],
+                    "marketcap": row[2],
+                    "volume_24h": row[3],
+                    "timestamp": current_timestamp.isoformat()
+                }
+                for symbol_id, row in market_rows.items()
+            ])
+            
             # Publish event
             if saved_count > 0:
                 publish_event("market_metrics_update", {
@@ -257,35 +327,19 @@ class CoinGeckoIngestionService:
             return []
         
         # CoinGecko API allows up to 250 coin IDs per request
-        all_coins = []
         batch_size = 250
-        for i in range(0, len(coin_ids), batch_size):
-            batch = coin_ids[i:i + batch_size]
-            coin_ids_str = ",".join(batch)
-            
-            url = f"{self.base_url}/coins/markets"
-            params = {
+        all_coins = await self._fetch_markets_pages([
+            {
                 "vs_currency": "usd",
-                "ids": coin_ids_str,
+                "ids": ",".join(coin_ids[i:i + batch_size]),
                 "order": "market_cap_desc",
-                "per_page": len(batch),
+                "per_page": len(coin_ids[i:i + batch_size]),
                 "page": 1,
                 "sparkline": "false"
             }
-            
-            async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    all_coins.extend(data)
-                    logger.info(f"Fetched market data for {len(data)} coins")
-                else:
-                    logger.error(f"Failed to fetch CoinGecko data: {response.status}")
-                    if response.status == 429:
-                        logger.warning("Rate limited by CoinGecko, waiting 60 seconds...")
-                        await asyncio.sleep(60)
-                        continue
-                    response.raise_for_status()
-                    break
+            for i in range(0, len(coin_ids), batch_size)
+        ])
+        logger.info(f"Fetched market data for {len(all_coins)} coins")
         
         return all_coins
     
@@ -303,37 +357,19 @@ class CoinGeckoIngestionService:
             return []
         
         # CoinGecko API allows up to 250 coin IDs per request
-        all_coins = []
         batch_size = 250
-        for i in range(0, len(coin_ids), batch_size):
-            batch = coin_ids[i:i + batch_size]
-            coin_ids_str = ",".join(batch)
-            
-            url = f"{self.base_url}/coins/markets"
-            params = {
+        all_coins = await self._fetch_markets_pages([
+            {
                 "vs_currency": "usd",
-                "ids": coin_ids_str,
+                "ids": ",".join(coin_ids[i:i + batch_size]),
                 "order": "market_cap_desc",
-                "per_page": len(batch),
+                "per_page": len(coin_ids[i:i + batch_size]),
                 "page": 1,
                 "sparkline": "false"
             }
-            
-            async with COINGECKO_RATE_LIMIT:
-                async with COINGECKO_MINUTE_LIMIT:
-                    async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            all_coins.extend(data)
-                            logger.info(f"Fetched market data for {len(data)} coins by IDs")
-                        else:
-                            logger.error(f"Failed to fetch CoinGecko data: {response.status}")
-                            if response.status == 429:
-                                logger.warning("Rate limited by CoinGecko, waiting 60 seconds...")
-                                await asyncio.sleep(60)
-                                continue
-                            response.raise_for_status()
-                            break
+            for i in range(0, len(coin_ids), batch_size)
+        ])
+        logger.info(f"Fetched market data for {len(all_coins)} coins by IDs")
         
         return all_coins
     
@@ -357,7 +393,8 @@ class CoinGeckoIngestionService:
         
         # Update database (create_symbols=False means only update existing symbols)
         with DatabaseManager() as db:
-            await self.save_market_metrics(
+            await asyncio.to_thread(
+                self.save_market_metrics,
                 db, 
                 coins_data, 
                 binance_service=binance_service,
@@ -369,23 +406,30 @@ class CoinGeckoIngestionService:
         """Ingest top market metrics from CoinGecko, filtered to only Binance perpetual contracts"""
         logger.info(f"Starting CoinGecko ingestion for top {limit} coins")
         
-        # Fetch market metrics
-        coins_data = await self.fetch_top_market_metrics(limit)
+        # Fetch market metrics and the Binance perpetual list concurrently
+        if binance_service:
+            coins_data, available_symbols = await asyncio.gather(
+                self.fetch_top_market_metrics(limit),
+                binance_service.get_available_perpetual_symbols()
+            )
+        else:
+            coins_data = await self.fetch_top_market_metrics(limit)
         if not coins_data:
             logger.warning("No market metrics fetched from CoinGecko")
             return
         
         # Filter to only include symbols available on Binance perpetual contracts
         if binance_service:
-            available_symbols = await binance_service.get_available_perpetual_symbols()
             if available_symbols:
                 filtered_coins = []
                 for coin in coins_data:
                     symbol = self.map_coin_to_symbol(coin)
-                    if symbol and symbol in available_symbols:
+                    if symbol in available_symbols:
+                        # save_market_metrics uses this instead of mapping the coin again
+                        coin["_binance_symbol"] = symbol
                         filtered_coins.append(coin)
                     else:
-                        logger.debug(f"Filtered out {coin.get('id', 'unknown')} - not available as perpetual on Binance")
+                        logger.debug("coin_not_binance_perpetual", coin_id=coin.get("id", "unknown"))
                 
                 coins_data = filtered_coins
                 logger.info(f"Filtered to {len(coins_data)} coins available as Binance perpetual contracts")
@@ -394,7 +438,7 @@ class CoinGeckoIngestionService:
         
         # Save to database
         with DatabaseManager() as db:
-            await self.save_market_metrics(db, coins_data, binance_service=binance_service)
+            await asyncio.to_thread(self.save_market_metrics, db, coins_data, binance_service=binance_service)
     
     def extract_base_asset(self, symbol: str) -> Optional[str]:
         """Extract base asset from Binance symbol (e.g., BTC from BTCUSDT)"""
@@ -539,7 +583,7 @@ class CoinGeckoIngestionService:
                 async with COINGECKO_MINUTE_LIMIT:
                     async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = await response.json(loads=orjson.loads)
                             coins = data.get("coins", [])
                             
                             # Try to find exact match by ticker (case-insensitive)
@@ -554,8 +598,9 @@ class CoinGeckoIngestionService:
                             
                             return None
                         elif response.status == 429:
-                            logger.warning("Rate limited by CoinGecko search, waiting 60 seconds...")
-                            await asyncio.sleep(60)
+                            delay = retry_after_seconds(response.headers, 60)
+                            logger.warning(f"Rate limited by CoinGecko search, waiting {delay} seconds...")
+                            await asyncio.sleep(delay)
                             return None
                         else:
                             logger.debug(f"CoinGecko search failed for {ticker}: {response.status}")
@@ -586,13 +631,14 @@ class CoinGeckoIngestionService:
                 async with COINGECKO_MINUTE_LIMIT:
                     async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = await response.json(loads=orjson.loads)
                             if data and len(data) > 0:
                                 return data[0]
                             return None
                         elif response.status == 429:
-                            logger.warning("Rate limited by CoinGecko, waiting 60 seconds...")
-                            await asyncio.sleep(60)
+                            delay = retry_after_seconds(response.headers, 60)
+                            logger.warning(f"Rate limited by CoinGecko, waiting {delay} seconds...")
+                            await asyncio.sleep(delay)
                             return None
                         else:
                             logger.debug(f"CoinGecko fetch failed for {coin_id}: {response.status}")
@@ -695,8 +741,12 @@ class CoinGeckoIngestionService:
             coingecko_limit = int(db_value) if db_value is not None else 250
             logger.info(f"Loaded coingecko_limit from ingestion_config: {coingecko_limit}")
         
-        # Step 1: Fetch Binance USDT perpetual futures
-        perpetual_symbols = await binance_service.get_available_perpetual_symbols()
+        # Step 1: Fetch Binance USDT perpetual futures (and, concurrently, the
+        # 24h tickers used for volume filtering in step 2)
+        perpetual_symbols, binance_tickers = await asyncio.gather(
+            binance_service.get_available_perpetual_symbols(),
+            binance_service.fetch_all_tickers_24h()
+        )
         if not perpetual_symbols:
             logger.warning("No Binance perpetual symbols found")
             return []
@@ -709,37 +759,30 @@ class CoinGeckoIngestionService:
         if usdt_symbols:
             with DatabaseManager() as db:
                 try:
-                    insert_sql = text("""
+                    # One multi-row insert; existing symbols are left untouched
+                    symbol_rows = [
+                        (symbol,) + split_symbol_components(symbol)
+                        for symbol in usdt_symbols
+                    ]
+                    bulk_execute_values(
+                        db,
+                        """
                         INSERT INTO symbols (symbol_name, base_asset, quote_asset, is_active, removed_at)
-                        VALUES (:symbol_name, :base_asset, :quote_asset, FALSE, NOW())
-                        ON CONFLICT (symbol_name) 
+                        VALUES %s
+                        ON CONFLICT (symbol_name)
                         DO NOTHING
-                    """)
-                    
-                    inserted_count = 0
-                    for symbol in usdt_symbols:
-                        try:
-                            # Extract base and quote assets using repository function
-                            base_asset, quote_asset = split_symbol_components(symbol)
-                            
-                            db.execute(insert_sql, {
-                                "symbol_name": symbol,
-                                "base_asset": base_asset,
-                                "quote_asset": quote_asset
-                            })
-                            inserted_count += 1
-                        except Exception as e:
-                            logger.error(f"Error inserting symbol {symbol}: {e}")
-                            continue
+                        """,
+                        symbol_rows,
+                        template="(%s, %s, %s, FALSE, NOW())"
+                    )
                     
                     db.commit()
-                    logger.info(f"Saved {inserted_count} symbols to symbols table")
+                    logger.info(f"Saved {len(symbol_rows)} symbols to symbols table")
                 except Exception as e:
                     logger.error(f"Error saving symbols to database: {e}")
                     db.rollback()
         
-        # Step 2: Fetch Binance ticker data for volume filtering
-        binance_tickers = await binance_service.fetch_all_tickers_24h()
+        # Step 2: Binance ticker data for volume filtering (fetched in step 1)
         logger.info(f"Retrieved {len(binance_tickers)} tickers from Binance")
         
         # Step 3: Combine perpetual_symbols and binance_tickers, filter by volume
@@ -789,57 +832,59 @@ class CoinGeckoIngestionService:
         # Step 4: Process new symbols - search CoinGecko and insert into database
         if new_symbols:
             logger.info(f"Processing {len(new_symbols)} new symbols, searching CoinGecko")
-            inserted_new_count = 0
+            matching_rows = []
             
-            insert_sql = text("""
-                INSERT INTO binance_coingecko_matching 
-                (binance_symbol, coingecko_id, base_asset, normalized_base, 
-                 coingecko_symbol, updated_at)
-                VALUES 
-                (:binance_symbol, :coingecko_id, :base_asset, :normalized_base,
-                 :coingecko_symbol, NOW())
-                ON CONFLICT (binance_symbol) 
-                DO NOTHING
-            """)
+            # Search first, then write every match in one statement, so no
+            # DB connection is held while waiting on CoinGecko
+            for binance_symbol in new_symbols:
+                try:
+                    # Extract and normalize base asset
+                    base_asset = self.extract_base_asset(binance_symbol)
+                    if not base_asset:
+                        continue
+                    
+                    normalized_base = self.normalize_base_asset(base_asset)
+                    
+                    # Search CoinGecko for this symbol
+                    coin_data = await self.enrich_asset_with_coingecko(normalized_base)
+                    if not coin_data and normalized_base != base_asset.upper():
+                        coin_data = await self.enrich_asset_with_coingecko(base_asset.upper())
+                    
+                    if coin_data:
+                        coingecko_id = coin_data.get("id", "")
+                        coingecko_symbol = coin_data.get("symbol", "").upper()
+                        matching_rows.append(
+                            (binance_symbol, coingecko_id, base_asset, normalized_base, coingecko_symbol)
+                        )
+                        
+                        # Add to mapping for later use
+                        symbol_to_coingecko_id[binance_symbol] = coingecko_id
+                        logger.debug(f"Found CoinGecko data for {binance_symbol}")
+                except Exception as e:
+                    logger.error(f"Error processing new symbol {binance_symbol}: {e}")
+                    continue
             
-            with DatabaseManager() as db:
-                for binance_symbol in new_symbols:
+            if matching_rows:
+                with DatabaseManager() as db:
                     try:
-                        # Extract and normalize base asset
-                        base_asset = self.extract_base_asset(binance_symbol)
-                        if not base_asset:
-                            continue
-                        
-                        normalized_base = self.normalize_base_asset(base_asset)
-                        
-                        # Search CoinGecko for this symbol
-                        coin_data = await self.enrich_asset_with_coingecko(normalized_base)
-                        if not coin_data and normalized_base != base_asset.upper():
-                            coin_data = await self.enrich_asset_with_coingecko(base_asset.upper())
-                        
-                        if coin_data:
-                            coingecko_id = coin_data.get("id", "")
-                            coingecko_symbol = coin_data.get("symbol", "").upper()
-                            
-                            # Insert into database
-                            db.execute(insert_sql, {
-                                "binance_symbol": binance_symbol,
-                                "coingecko_id": coingecko_id,
-                                "base_asset": base_asset,
-                                "normalized_base": normalized_base,
-                                "coingecko_symbol": coingecko_symbol
-                            })
-                            
-                            # Add to mapping for later use
-                            symbol_to_coingecko_id[binance_symbol] = coingecko_id
-                            inserted_new_count += 1
-                            logger.debug(f"Found and inserted CoinGecko data for {binance_symbol}")
+                        bulk_execute_values(
+                            db,
+                            """
+                            INSERT INTO binance_coingecko_matching
+                            (binance_symbol, coingecko_id, base_asset, normalized_base,
+                             coingecko_symbol, updated_at)
+                            VALUES %s
+                            ON CONFLICT (binance_symbol)
+                            DO NOTHING
+                            """,
+                            matching_rows,
+                            template="(%s, %s, %s, %s, %s, NOW())"
+                        )
+                        db.commit()
+                        logger.info(f"Inserted {len(matching_rows)} new symbols into database")
                     except Exception as e:
-                        logger.error(f"Error processing new symbol {binance_symbol}: {e}")
-                        continue
-                
-                db.commit()
-                logger.info(f"Inserted {inserted_new_count} new symbols into database")
+                        logger.error(f"Error saving CoinGecko matches to database: {e}")
+                        db.rollback()
         
         # Step 5: Fetch market data from CoinGecko and build enriched assets
         if not symbol_to_coingecko_id:
@@ -954,12 +999,13 @@ class CoinGeckoIngestionService:
         binance_service: BinanceIngestionService,
         min_binance_volume: Optional[float] = None,
         min_market_cap: Optional[float] = None
-    ) -> Dict[str, List[str]]:
+    ) -> Optional[Dict[str, List[str]]]:
         """Ingest from Binance perpetuals, enrich with CoinGecko, and save to database.
         
         Returns:
             Dict containing metadata about the ingestion run, including any newly
-            activated symbols that now qualify for backfilling.
+            activated symbols that now qualify for backfilling, or None if no
+            assets were fetched (e.g. Binance unreachable) and nothing was saved.
         """
         logger.info("Starting new ingestion flow with database save")
         
@@ -972,9 +1018,30 @@ class CoinGeckoIngestionService:
         
         if not enriched_assets:
             logger.warning("No enriched assets to save")
-            return {"newly_activated_symbols": []}
+            return None
         
-        # Save to database
+        # Save to database off the event loop
+        newly_activated_symbols, deactivated_count = await asyncio.to_thread(
+            self._save_perpetual_assets, enriched_assets, binance_service
+        )
+        logger.info(
+            "binance_ingestion_save_completed",
+            saved_assets=len(enriched_assets),
+            newly_activated=len(newly_activated_symbols),
+            deactivated=deactivated_count,
+        )
+        return {"newly_activated_symbols": newly_activated_symbols}
+    
+    def _save_perpetual_assets(
+        self,
+        enriched_assets: List[Dict],
+        binance_service: BinanceIngestionService
+    ) -> Tuple[List[str], int]:
+        """Save enriched assets and deactivate active symbols missing from them (blocking)
+        
+        Returns:
+            (newly activated symbols, number of symbols deactivated)
+        """
         with DatabaseManager() as db:
             def fetch_active_symbol_set() -> Set[str]:
                 result = db.execute(
@@ -989,7 +1056,7 @@ class CoinGeckoIngestionService:
             
             active_symbols_before = fetch_active_symbol_set()
             
-            await self.save_market_metrics(
+            self.save_market_metrics(
                 db,
                 enriched_assets,
                 binance_service=binance_service,
@@ -1011,10 +1078,11 @@ class CoinGeckoIngestionService:
             }
             
             # Use SymbolLifecycleService for deactivation (proper service boundary)
+            deactivated_count = 0
             if symbols_to_deactivate:
                 from core.symbol_lifecycle_service import SymbolLifecycleService
                 lifecycle_service = SymbolLifecycleService()
-                deactivated_count = await lifecycle_service.deactivate_symbols(
+                deactivated_count = lifecycle_service.deactivate_symbols(
                     db, list(symbols_to_deactivate)
                 )
                 db.commit()
@@ -1025,12 +1093,5 @@ class CoinGeckoIngestionService:
             else:
                 logger.info("All active symbols are present in enriched assets, no deactivation needed")
         
-        newly_activated_symbols = list(active_symbols_after - active_symbols_before)
-        logger.info(
-            "binance_ingestion_save_completed",
-            saved_assets=len(enriched_assets),
-            newly_activated=len(newly_activated_symbols),
-            deactivated=len(symbols_to_deactivate),
-        )
-        return {"newly_activated_symbols": newly_activated_symbols}
+        return list(active_symbols_after - active_symbols_before), deactivated_count
 
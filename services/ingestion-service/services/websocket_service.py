@@ -4,36 +4,82 @@ Binance WebSocket service for real-time OHLCV data
 import sys
 import os
 import asyncio
-import json
+import itertools
+import logging
+import operator
 import time
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import List, Dict, Optional, Tuple
+import aiohttp
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, WebSocketException
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from decimal import Decimal
 import structlog
 
 # Add shared to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 
 from shared.database import DatabaseManager
-from shared.redis_client import publish_event, get_redis
+from shared.redis_client import publish_events, get_redis
 
 # Import from local modules (relative to ingestion-service root)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from utils.types import KlineData
 from utils.circuit_breaker import AsyncCircuitBreaker
-from config.settings import WS_BATCH_SIZE, WS_BATCH_TIMEOUT, WS_MAX_RECONNECT_DELAY, WS_PING_INTERVAL, WS_PING_TIMEOUT
-from database.repository import get_or_create_symbol_record, get_timeframe_id
+from config.settings import (
+    WS_BATCH_SIZE,
+    WS_BATCH_TIMEOUT,
+    WS_MAX_RECONNECT_DELAY,
+    WS_PING_INTERVAL,
+    WS_PING_TIMEOUT,
+    WS_COMPRESSION
+)
+from database.repository import (
+    get_or_create_symbol_record,
+    get_timeframe_id,
+    bulk_execute_values,
+    copy_candles,
+    use_async_commit,
+    CANDLE_COPY_MIN_ROWS
+)
 
 logger = structlog.get_logger(__name__)
 
+# Incoming frames buffered per connection before reads apply TCP backpressure
+# (websockets defaults to 32, too few for a burst of closing candles)
+WS_MAX_QUEUE = 4096
+# Most frames the consumer takes off the queue and parses as one burst
+WS_MAX_BURST = 512
+
+# Adaptive batch sizing: every WS_BATCH_TUNE_EVERY database flushes, grow
+# batch_size 25% while the flush-latency EWMA is under half the target and
+# shrink it 25% once it is over (never below the configured WS_BATCH_SIZE)
+WS_FLUSH_TARGET_SECONDS = 0.1
+WS_FLUSH_EWMA_ALPHA = 0.2
+WS_BATCH_TUNE_EVERY = 10
+WS_BATCH_SIZE_MAX = 5000
+
+# Kline open time (ms) -> aware datetime. Every update of a candle, and every
+# symbol on the same timeframe, shares one open time, so nearly all lookups hit
+_KLINE_OPEN_TIMES: Dict[int, datetime] = {}
+_KLINE_OPEN_TIMES_MAX = 1024  # Cleared wholesale when full
+
+# Binance kline payload keys: symbol, interval, closed, open/close time, OHLCV
+_KLINE_FIELDS = operator.itemgetter("s", "i", "x", "t", "T", "o", "h", "l", "c", "v")
+
+# Our timeframe names -> Binance kline intervals (identity today; lowercase except month)
+BINANCE_INTERVALS = MappingProxyType({
+    interval: interval
+    for interval in ("1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M")
+})
+
 class BinanceWebSocketService:
     """WebSocket service for real-time OHLCV data from Binance Futures"""
     
-    def __init__(self):
+    def __init__(self, http_session: Optional[aiohttp.ClientSession] = None):
+        self.http_session = http_session  # Shared session for the REST fallback
         self.ws_url = "wss://fstream.binance.com/ws"
         self.ws_stream_url = "wss://fstream.binance.com/stream"  # For multi-stream
         self.websocket = None
@@ -47,9 +93,17 @@ class BinanceWebSocketService:
         self.last_message_time = None
         self.batch_buffer = []  # Buffer for batch inserts
         self._batch_lock = asyncio.Lock()  # Lock for thread-safe batch buffer access
+        self._batch_ready = asyncio.Event()  # Set once batch_buffer reaches batch_size
+        self._frames = asyncio.Queue(maxsize=WS_MAX_QUEUE)  # (generation, frame) from every connection
+        self._reader_tasks = []  # One long-lived recv loop per open connection
+        self._connection_generation = 0  # Bumped per connect so frames from closed sockets are dropped
+        self.candles_saved = 0
+        self.candles_failed = 0
         self.last_batch_flush = time.time()  # Initialize to current time
         self.batch_size = WS_BATCH_SIZE
         self.batch_timeout = WS_BATCH_TIMEOUT
+        self._flush_latency_ewma = None  # Seconds per database flush
+        self._flushes_since_tune = 0
         self.total_batches_flushed = 0
         self.total_candles_batched = 0
         self.max_url_length = 2000  # Maximum URL length (leaving room for base URL)
@@ -57,6 +111,9 @@ class BinanceWebSocketService:
         self.current_timeframes = []  # Store current timeframes for dynamic updates
         self._symbols_lock = asyncio.Lock()  # Lock for thread-safe symbol updates
         self._redis_client = get_redis()  # Redis client for batch persistence
+        # Resolved once: a disabled structlog debug call still builds its event
+        # dict and runs the processor chain before filter_by_level drops it
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
     async def __aenter__(self):
         return self
@@ -105,7 +162,7 @@ class BinanceWebSocketService:
             try:
                 key = f"websocket:batch_buffer:{id(self)}"
                 # Serialize batch buffer
-                data = json.dumps([
+                data = orjson.dumps([
                     {
                         "symbol": c.get("symbol"),
                         "timeframe": c.get("timeframe"),
@@ -141,7 +198,7 @@ class BinanceWebSocketService:
                 key = f"websocket:batch_buffer:{id(self)}"
                 data = await asyncio.to_thread(self._redis_client.get, key)
                 if data:
-                    batch_data = json.loads(data)
+                    batch_data = orjson.loads(data)
                     # Convert back to candle format
                     restored = []
                     for c in batch_data:
@@ -187,6 +244,12 @@ class BinanceWebSocketService:
         
         self.websockets = []
         self.is_connected = False
+        await self._stop_readers()
+        # Wake a consumer blocked on an empty queue so it notices and reconnects
+        try:
+            self._frames.put_nowait((self._connection_generation, None))
+        except asyncio.QueueFull:
+            pass
         logger.info("All WebSocket connections closed")
     
     def map_timeframe_to_binance_interval(self, timeframe: str) -> str:
@@ -197,28 +260,9 @@ class BinanceWebSocketService:
         """
         # Normalize input (lowercase except for month)
         normalized = timeframe.lower() if timeframe != "1M" else "1M"
-        
-        timeframe_map = {
-            "1m": "1m",
-            "3m": "3m",
-            "5m": "5m",
-            "15m": "15m",
-            "30m": "30m",
-            "1h": "1h",
-            "2h": "2h",
-            "4h": "4h",
-            "6h": "6h",
-            "8h": "8h",
-            "12h": "12h",
-            "1d": "1d",
-            "3d": "3d",
-            "1w": "1w",
-            "1M": "1M"  # Month (uppercase)
-        }
-        
-        mapped = timeframe_map.get(normalized, timeframe)
-        if mapped != timeframe:
-            logger.debug(f"Mapped timeframe {timeframe} -> {mapped}")
+        mapped = BINANCE_INTERVALS.get(normalized, timeframe)
+        if mapped != timeframe and self._debug_enabled:
+            logger.debug("timeframe_mapped", timeframe=timeframe, interval=mapped)
         return mapped
     
     def build_stream_name(self, symbol: str, interval: str) -> str:
@@ -233,26 +277,20 @@ class BinanceWebSocketService:
     
     def build_multi_stream_url(self, symbols: List[str], timeframes: List[str]) -> str:
         """Build multi-stream URL for multiple symbols and timeframes, including ticker streams"""
-        streams = []
-        # Add kline streams
-        for symbol in symbols:
-            for timeframe in timeframes:
-                stream_name = self.build_stream_name(symbol, timeframe)
-                streams.append(stream_name)
-        # Add ticker streams (one per symbol for real-time price/volume updates)
-        for symbol in symbols:
-            ticker_stream = self.build_ticker_stream_name(symbol)
-            streams.append(ticker_stream)
-        
+        # Kline streams, then one ticker stream per symbol for real-time price/volume updates
+        streams = itertools.chain(
+            (self.build_stream_name(symbol, timeframe) for symbol, timeframe in itertools.product(symbols, timeframes)),
+            (self.build_ticker_stream_name(symbol) for symbol in symbols)
+        )
         # Multi-stream format: ?streams=stream1/stream2/stream3
-        streams_str = "/".join(streams)
-        return f"{self.ws_stream_url}?streams={streams_str}"
+        return f"{self.ws_stream_url}?streams={'/'.join(streams)}"
     
     def build_stream_batches(self, symbols: List[str], timeframes: List[str]) -> List[Tuple[List[str], List[str]]]:
         """
         Split symbols into batches that fit within URL length limit.
         
-        Calculates actual URL length for each batch to ensure it stays within limits.
+        The URL length of a batch is tracked incrementally: each symbol adds its
+        kline and ticker stream names plus one "/" separator per stream.
         
         Args:
             symbols: List of symbols to subscribe to
@@ -262,36 +300,27 @@ class BinanceWebSocketService:
             List of tuples (symbol_batch, timeframe_list) where each batch fits in URL length limit
         """
         batches = []
-        base_url_length = len(self.ws_stream_url) + len("?streams=")
+        # The first stream has no leading separator
+        empty_url_length = len(self.ws_stream_url) + len("?streams=") - 1
         
         current_batch_symbols = []
+        current_url_length = empty_url_length
         
         for symbol in symbols:
-            # Try adding this symbol to current batch
-            test_symbols = current_batch_symbols + [symbol]
-            
-            # Build streams for test batch
-            test_streams = []
-            for s in test_symbols:
-                # Add kline streams for this symbol
-                for timeframe in timeframes:
-                    test_streams.append(self.build_stream_name(s, timeframe))
-                # Add ticker stream for this symbol
-                test_streams.append(self.build_ticker_stream_name(s))
-            
-            # Build test URL
-            streams_str = "/".join(test_streams)
-            test_url = f"{self.ws_stream_url}?streams={streams_str}"
-            test_url_length = len(test_url)
+            symbol_length = len(self.build_ticker_stream_name(symbol)) + 1 + sum(
+                len(self.build_stream_name(symbol, timeframe)) + 1 for timeframe in timeframes
+            )
             
-            # Check if test URL exceeds limit
-            if test_url_length > self.max_url_length and current_batch_symbols:
+            # Check if adding this symbol exceeds the limit
+            if current_url_length + symbol_length > self.max_url_length and current_batch_symbols:
                 # Current batch is full, save it and start new one
-                batches.append((current_batch_symbols.copy(), timeframes))
+                batches.append((current_batch_symbols, timeframes))
                 current_batch_symbols = [symbol]
+                current_url_length = empty_url_length + symbol_length
             else:
                 # Add symbol to current batch
                 current_batch_symbols.append(symbol)
+                current_url_length += symbol_length
         
         # Add the last batch if it has symbols
         if current_batch_symbols:
@@ -306,89 +335,107 @@ class BinanceWebSocketService:
         - Single: {"e":"kline","E":...,"s":"BTCUSDT","k":{...}}
         - Multi: {"stream":"btcusdt@kline_1m","data":{"e":"kline",...}}
         """
-        try:
-            # Handle multi-stream format
-            if "stream" in message and "data" in message:
-                data = message["data"]
-            # Handle single-stream format
-            elif "e" in message and message.get("e") == "kline":
-                data = message
-            else:
-                return None
-            
-            if data.get("e") != "kline":
-                return None
-            
-            k = data.get("k", {})
-            if not k:
-                return None
-            
-            # Extract OHLCV data
-            symbol = k.get("s")  # Symbol
-            interval = k.get("i")  # Interval
-            is_closed = k.get("x", False)  # True if candle is closed
-            
-            # Timestamps (ms since epoch)
-            open_ts = k.get("t")  # Open time
-            close_ts = k.get("T")  # Close time
-            
-            # Validate timestamps
-            if not open_ts:
-                logger.warning("Missing open timestamp in kline data")
-                return None
-            
-            # Create timezone-aware timestamp (UTC)
-            timestamp = datetime.fromtimestamp(open_ts / 1000, tz=timezone.utc)
-            
-            # OHLCV values - validate and convert
-            open_price = float(k.get("o", 0))
-            high_price = float(k.get("h", 0))
-            low_price = float(k.get("l", 0))
-            close_price = float(k.get("c", 0))
-            volume = float(k.get("v", 0))
-            
-            # Validate OHLCV data
-            if not all([open_price > 0, high_price > 0, low_price > 0, close_price > 0]):
-                logger.warning(
-                    "kline_invalid_prices",
-                    symbol=symbol,
-                    open=open_price,
-                    high=high_price,
-                    low=low_price,
-                    close=close_price
-                )
-                return None
-            
-            if high_price < low_price:
-                logger.warning(
-                    "kline_invalid_high_low",
-                    symbol=symbol,
-                    high=high_price,
-                    low=low_price
+        klines = self.parse_kline_messages([message])
+        return klines[0] if klines else None
+    
+    def parse_kline_messages(self, messages: List[Dict]) -> List[KlineData]:
+        """Parse a burst of decoded WebSocket messages, keeping only valid klines
+        
+        Same formats and validation as parse_kline_message; non-kline
+        messages are skipped. Hot names are bound to locals once per burst.
+        """
+        from_ts = datetime.fromtimestamp
+        utc = timezone.utc
+        to_float = float
+        open_times = _KLINE_OPEN_TIMES
+        kline_fields = _KLINE_FIELDS
+        klines = []
+        for message in messages:
+            try:
+                # Handle multi-stream format
+                if "stream" in message and "data" in message:
+                    data = message["data"]
+                # Handle single-stream format
+                elif message.get("e") == "kline":
+                    data = message
+                else:
+                    continue
+                
+                if data.get("e") != "kline":
+                    continue
+                
+                k = data.get("k")
+                if not k:
+                    continue
+                
+                # All fields in one C call; a partial kline falls back to defaults
+                try:
+                    symbol, interval, is_closed, open_ts, close_ts, o, h, l, c, v = kline_fields(k)
+                except KeyError:
+                    symbol, interval, is_closed, open_ts, close_ts = (
+                        k.get("s"), k.get("i"), k.get("x", False), k.get("t"), k.get("T")
+                    )
+                    o, h, l, c, v = (k.get(field, 0) for field in "ohlcv")
+                
+                # Timestamps (ms since epoch)
+                if not open_ts:
+                    logger.warning("Missing open timestamp in kline data")
+                    continue
+                
+                # OHLCV values - validate and convert
+                open_price = to_float(o)
+                high_price = to_float(h)
+                low_price = to_float(l)
+                close_price = to_float(c)
+                
+                # Validate OHLCV data (one combined check on the common path)
+                if not (open_price > 0 and close_price > 0 and low_price > 0 and high_price >= low_price):
+                    if open_price <= 0 or high_price <= 0 or low_price <= 0 or close_price <= 0:
+                        logger.warning(
+                            "kline_invalid_prices",
+                            symbol=symbol,
+                            open=open_price,
+                            high=high_price,
+                            low=low_price,
+                            close=close_price
+                        )
+                    else:
+                        logger.warning(
+                            "kline_invalid_high_low",
+                            symbol=symbol,
+                            high=high_price,
+                            low=low_price
+                        )
+                    continue
+                
+                # Timezone-aware (UTC) open time, converted once per distinct value
+                timestamp = open_times.get(open_ts)
+                if timestamp is None:
+                    if len(open_times) >= _KLINE_OPEN_TIMES_MAX:
+                        open_times.clear()
+                    timestamp = open_times[open_ts] = from_ts(open_ts / 1000, tz=utc)
+                
+                klines.append({
+                    "symbol": symbol,
+                    "timeframe": interval,
+                    "open_ts": open_ts,
+                    "close_ts": close_ts,
+                    "open": open_price,
+                    "high": high_price,
+                    "low": low_price,
+                    "close": close_price,
+                    "volume": to_float(v),
+                    "is_closed": is_closed,  # True if candle is closed
+                    "timestamp": timestamp
+                })
+            except Exception as e:
+                self.parse_errors += 1
+                logger.error(
+                    "kline_parse_error",
+                    error=str(e),
+                    exc_info=True
                 )
-                return None
-            
-            return {
-                "symbol": symbol,
-                "timeframe": interval,
-                "open_ts": open_ts,
-                "close_ts": close_ts,
-                "open": open_price,
-                "high": high_price,
-                "low": low_price,
-                "close": close_price,
-                "volume": volume,
-                "is_closed": is_closed,
-                "timestamp": timestamp
-            }
-        except Exception as e:
-            self.parse_errors += 1
-            logger.error(
-                "kline_parse_error",
-                error=str(e),
-                exc_info=True
-            )
-            return None
+        return klines
     
     def parse_ticker_message(self, message: Dict) -> Optional[Dict]:
         """Parse ticker WebSocket message for real-time price and volume updates
@@ -428,7 +475,14 @@ class BinanceWebSocketService:
                 volume_24h = float(quote_volume) if quote_volume else None
                 change24h = float(price_change_percent) if price_change_percent else None
             except (ValueError, TypeError):
-                logger.debug(f"Failed to convert ticker values for {symbol}: price={last_price}, volume={quote_volume}, change={price_change_percent}")
+                if self._debug_enabled:
+                    logger.debug(
+                        "ticker_values_invalid",
+                        symbol=symbol,
+                        price=last_price,
+                        volume=quote_volume,
+                        change=price_change_percent
+                    )
                 return None
             
             if price is None or price <= 0:
@@ -441,7 +495,8 @@ class BinanceWebSocketService:
                 "change24h": change24h
             }
         except Exception as e:
-            logger.debug(f"Error parsing ticker message: {e}")
+            if self._debug_enabled:
+                logger.debug("ticker_parse_error", error=str(e))
             return None
     
     async def flush_batch(self) -> Tuple[int, int]:
@@ -464,18 +519,31 @@ class BinanceWebSocketService:
         failed_count = 0
         
         try:
-            # Separate closed and in-progress candles
-            closed_candles = [c for c in batch if c.get("is_closed", False)]
-            in_progress_candles = [c for c in batch if not c.get("is_closed", False)]
+            # Separate closed and in-progress candles in one pass. Each kline
+            # update carries the candle's cumulative OHLCV, so only the latest
+            # in-progress update per candle is worth publishing
+            closed_candles = []
+            latest_in_progress = {}
+            add_closed = closed_candles.append
+            for candle in batch:
+                key = (candle.get("symbol"), candle.get("timeframe"), candle.get("timestamp"))
+                if candle.get("is_closed", False):
+                    add_closed(candle)
+                    latest_in_progress.pop(key, None)  # Superseded by the close
+                else:
+                    latest_in_progress[key] = candle
+            in_progress_candles = list(latest_in_progress.values())
             
             # Only save closed candles to database using DatabaseManager
             if closed_candles:
                 try:
-                    with DatabaseManager() as db:
-                        saved, failed = await self._batch_insert_candles(db, closed_candles, is_closed=True)
-                        saved_count += saved
-                        failed_count += failed
-                        db.commit()
+                    # Blocking Postgres work runs in a worker thread so the
+                    # receive loop keeps draining frames during the commit
+                    started = time.perf_counter()
+                    saved, failed = await asyncio.to_thread(self._write_closed_candles, closed_candles)
+                    saved_count += saved
+                    failed_count += failed
+                    self._tune_batch_size(time.perf_counter() - started)
                 except Exception as e:
                     logger.error("batch_flush_db_error", error=str(e), exc_info=True)
                     # Restore batch on error for retry
@@ -485,31 +553,23 @@ class BinanceWebSocketService:
             
             # Publish WebSocket events for ALL candles (closed and in-progress) for real-time display
             # Closed candles are published in _batch_insert_candles, so publish in-progress here
-            for kline_data in in_progress_candles:
-                try:
-                    timestamp = kline_data.get("timestamp")
-                    publish_event("candle_update", {
-                        "symbol": kline_data.get("symbol"),
-                        "timeframe": kline_data.get("timeframe"),
-                        "timestamp": timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp),
-                        "open": float(kline_data.get("open", 0)),
-                        "high": float(kline_data.get("high", 0)),
-                        "low": float(kline_data.get("low", 0)),
-                        "close": float(kline_data.get("close", 0)),
-                        "volume": float(kline_data.get("volume", 0)),
-                        "closed": False  # Indicates this is an in-progress candle
-                    })
-                except Exception as e:
-                    logger.debug(f"Failed to publish in-progress candle event: {e}")
+            try:
+                publish_events("candle_update", [
+                    self._candle_event(kline_data, closed=False) for kline_data in in_progress_candles
+                ])
+            except Exception as e:
+                logger.debug(f"Failed to publish in-progress candle events: {e}")
             
             if saved_count > 0:
                 self.total_batches_flushed += 1
                 self.total_candles_batched += saved_count
-                logger.debug(
-                    f"Flushed batch: {saved_count} closed candles saved to DB, "
-                    f"{len(in_progress_candles)} in-progress candles published via WebSocket only "
-                    f"(total batches: {self.total_batches_flushed})"
-                )
+                if self._debug_enabled:
+                    logger.debug(
+                        "batch_flushed",
+                        saved=saved_count,
+                        in_progress_published=len(in_progress_candles),
+                        total_batches=self.total_batches_flushed
+                    )
             
             return saved_count, failed_count
         except Exception as e:
@@ -519,7 +579,58 @@ class BinanceWebSocketService:
                 self.batch_buffer.extend(batch)
             return 0, len(batch)
     
-    async def _batch_insert_candles(self, db: Session, candles: List[Dict], is_closed: bool) -> Tuple[int, int]:
+    def _tune_batch_size(self, flush_seconds: float):
+        """Fold one flush latency into the EWMA and resize batch_size periodically"""
+        if self._flush_latency_ewma is None:
+            self._flush_latency_ewma = flush_seconds
+        else:
+            self._flush_latency_ewma += WS_FLUSH_EWMA_ALPHA * (flush_seconds - self._flush_latency_ewma)
+        
+        self._flushes_since_tune += 1
+        if self._flushes_since_tune < WS_BATCH_TUNE_EVERY:
+            return
+        self._flushes_since_tune = 0
+        
+        if self._flush_latency_ewma < WS_FLUSH_TARGET_SECONDS / 2:
+            new_size = min(int(self.batch_size * 1.25) + 1, WS_BATCH_SIZE_MAX)
+        elif self._flush_latency_ewma > WS_FLUSH_TARGET_SECONDS:
+            new_size = max(int(self.batch_size * 0.75), WS_BATCH_SIZE)
+        else:
+            return
+        if new_size != self.batch_size:
+            logger.info(
+                "websocket_batch_size_tuned",
+                old_size=self.batch_size,
+                new_size=new_size,
+                flush_latency_ms=round(self._flush_latency_ewma * 1000, 1)
+            )
+            self.batch_size = new_size
+    
+    @staticmethod
+    def _candle_event(kline_data: Dict, closed: bool) -> Dict:
+        """Build the candle_update event payload with full OHLCV data"""
+        timestamp = kline_data.get("timestamp")
+        return {
+            "symbol": kline_data.get("symbol"),
+            "timeframe": kline_data.get("timeframe"),
+            "timestamp": timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp),
+            "open": float(kline_data.get("open", 0)),
+            "high": float(kline_data.get("high", 0)),
+            "low": float(kline_data.get("low", 0)),
+            "close": float(kline_data.get("close", 0)),
+            "volume": float(kline_data.get("volume", 0)),
+            "closed": closed  # False for an in-progress candle
+        }
+    
+    def _write_closed_candles(self, candles: List[Dict]) -> Tuple[int, int]:
+        """Insert closed candles in their own session and commit (blocking; run via asyncio.to_thread)"""
+        with DatabaseManager() as db:
+            use_async_commit(db)  # Closed candles can be re-fetched over REST
+            saved, failed = self._batch_insert_candles(db, candles, is_closed=True)
+            db.commit()
+        return saved, failed
+    
+    def _batch_insert_candles(self, db: Session, candles: List[Dict], is_closed: bool) -> Tuple[int, int]:
         """Insert a batch of closed candles to database
         
         Note: This method should only be called with closed candles (is_closed=True).
@@ -531,8 +642,9 @@ class BinanceWebSocketService:
         saved_count = 0
         failed_count = 0
         
-        # Build parameter lists for bulk insert
-        params_list = []
+        # Build insert rows keyed by conflict target: a multi-row upsert may not
+        # touch the same row twice, so a repeated candle keeps its latest values
+        rows_by_key = {}
         symbol_timeframe_map = {}  # Cache symbol_id and timeframe_id lookups
         
         for kline_data in candles:
@@ -557,21 +669,23 @@ class BinanceWebSocketService:
                 else:
                     symbol_id, timeframe_id = symbol_timeframe_map[cache_key]
                 
-                params_list.append({
-                    "symbol_id": symbol_id,
-                    "timeframe_id": timeframe_id,
-                    "timestamp": timestamp,
-                    "open": Decimal(str(kline_data["open"])),
-                    "high": Decimal(str(kline_data["high"])),
-                    "low": Decimal(str(kline_data["low"])),
-                    "close": Decimal(str(kline_data["close"])),
-                    "volume": Decimal(str(kline_data["volume"]))
-                })
+                # Prices are floats from parse_kline_message; psycopg2 renders them
+                # with repr(), the same digits a Decimal(str(...)) round-trip gave
+                rows_by_key[(symbol_id, timeframe_id, timestamp)] = (
+                    symbol_id,
+                    timeframe_id,
+                    timestamp,
+                    kline_data["open"],
+                    kline_data["high"],
+                    kline_data["low"],
+                    kline_data["close"],
+                    kline_data["volume"]
+                )
             except Exception as e:
                 logger.error(f"Error preparing batch insert for candle: {e}")
                 failed_count += 1
         
-        if not params_list:
+        if not rows_by_key:
             return 0, failed_count
         
         # Only build SQL statement for closed candles
@@ -581,47 +695,48 @@ class BinanceWebSocketService:
             logger.warning("Attempted to insert in-progress candles to database - this should not happen")
             return 0, len(candles)
         
-        # SQL statement for closed candles only - full upsert
-        stmt = text("""
-            INSERT INTO ohlcv_candles 
-            (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
-            VALUES (:symbol_id, :timeframe_id, :timestamp, :open, :high, :low, :close, :volume)
-            ON CONFLICT (symbol_id, timeframe_id, timestamp) 
-            DO UPDATE SET
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume
-        """)
-        
         try:
-            # Execute batch insert
-            db.execute(stmt, params_list)
-            db.flush()
-            saved_count = len(params_list)
+            # Closed candles only - full upsert. Large flushes (e.g. a buffer
+            # restored after reconnect) COPY through staging; regular batches
+            # are one multi-row statement.
+            rows = list(rows_by_key.values())
+            if len(rows) >= CANDLE_COPY_MIN_ROWS:
+                copy_candles(db, rows, update_existing=True)
+            else:
+                bulk_execute_values(
+                    db,
+                    """
+                    INSERT INTO ohlcv_candles
+                    (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
+                    VALUES %s
+                    ON CONFLICT (symbol_id, timeframe_id, timestamp)
+                    DO UPDATE SET
+                        open = EXCLUDED.open,
+                        high = EXCLUDED.high,
+                        low = EXCLUDED.low,
+                        close = EXCLUDED.close,
+                        volume = EXCLUDED.volume
+                    WHERE (ohlcv_candles.open, ohlcv_candles.high, ohlcv_candles.low,
+                           ohlcv_candles.close, ohlcv_candles.volume)
+                        IS DISTINCT FROM
+                          (EXCLUDED.open, EXCLUDED.high, EXCLUDED.low,
+                           EXCLUDED.close, EXCLUDED.volume)
+                    """,
+                    rows
+                )
+            saved_count = len(rows_by_key)
             
-            # Publish events for closed candles with full OHLCV data
+            # Publish events for closed candles with full OHLCV data, pipelined
             # All candles in this method are closed (in-progress are filtered out earlier)
-            for kline_data in candles:
-                try:
-                    timestamp = kline_data.get("timestamp")
-                    publish_event("candle_update", {
-                        "symbol": kline_data.get("symbol"),
-                        "timeframe": kline_data.get("timeframe"),
-                        "timestamp": timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp),
-                        "open": float(kline_data.get("open", 0)),
-                        "high": float(kline_data.get("high", 0)),
-                        "low": float(kline_data.get("low", 0)),
-                        "close": float(kline_data.get("close", 0)),
-                        "volume": float(kline_data.get("volume", 0)),
-                        "closed": True
-                    })
-                except Exception as e:
-                    logger.debug(f"Failed to publish closed candle event: {e}")
+            try:
+                publish_events("candle_update", [
+                    self._candle_event(kline_data, closed=True) for kline_data in candles
+                ])
+            except Exception as e:
+                logger.debug(f"Failed to publish closed candle events: {e}")
         except Exception as e:
             logger.error(f"Error in batch insert: {e}", exc_info=True)
-            failed_count += len(params_list)
+            failed_count += len(rows_by_key)
             saved_count = 0
         
         return saved_count, failed_count
@@ -632,24 +747,167 @@ class BinanceWebSocketService:
         Returns:
             bool: True if added to batch, False if validation failed
         """
-        symbol = kline_data.get("symbol")
-        timeframe = kline_data.get("timeframe")
-        timestamp = kline_data.get("timestamp")
+        return await self.save_candles_from_websocket([kline_data]) == 1
+    
+    async def save_candles_from_websocket(self, klines: List[Dict]) -> int:
+        """Add a burst of candles to the batch buffer under one lock acquisition
         
-        # Validate required fields
-        if not all([symbol, timeframe, timestamp]):
-            logger.error(f"Missing required fields in kline_data: symbol={symbol}, timeframe={timeframe}, timestamp={timestamp}")
-            return False
+        Returns:
+            int: Number of candles added; the rest failed validation
+        """
+        valid = []
+        for kline_data in klines:
+            symbol = kline_data.get("symbol")
+            timeframe = kline_data.get("timeframe")
+            timestamp = kline_data.get("timestamp")
+            
+            # Validate required fields
+            if not all([symbol, timeframe, timestamp]):
+                logger.error(f"Missing required fields in kline_data: symbol={symbol}, timeframe={timeframe}, timestamp={timestamp}")
+                continue
+            
+            # Validate timestamp is timezone-aware
+            if timestamp.tzinfo is None:
+                logger.error(f"Timestamp is not timezone-aware for {symbol} {timeframe}")
+                continue
+            valid.append(kline_data)
         
-        # Validate timestamp is timezone-aware
-        if timestamp.tzinfo is None:
-            logger.error(f"Timestamp is not timezone-aware for {symbol} {timeframe}")
-            return False
+        if valid:
+            # Add to batch buffer with lock; the writer task does the flushing
+            async with self._batch_lock:
+                self.batch_buffer.extend(valid)
+                if len(self.batch_buffer) >= self.batch_size:
+                    self._batch_ready.set()
+        return len(valid)
+    
+    async def _flush_loop(self):
+        """Single writer for batch_buffer: flush once it fills or batch_timeout passes
         
-        # Add to batch buffer with lock
-        async with self._batch_lock:
-            self.batch_buffer.append(kline_data)
-        return True
+        The frame consumer only appends candles and sets _batch_ready, so no task
+        is created per message and receiving never waits on a flush decision.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.batch_timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            
+            try:
+                batch_saved, batch_failed = await self.flush_batch()
+            except Exception as e:
+                logger.error("batch_flush_loop_error", error=str(e), exc_info=True)
+                continue
+            self.candles_saved += batch_saved
+            self.candles_failed += batch_failed
+            self.last_batch_flush = time.time()
+    
+    async def _read_frames(self, ws, generation: int):
+        """Forward every frame from one connection into the shared frame queue
+        
+        Ends by queueing the exception that stopped recv() (ConnectionClosedOK on
+        an intentional close) so the consumer can reconnect.
+        """
+        try:
+            while True:
+                await self._frames.put((generation, await ws.recv()))
+        except Exception as e:
+            await self._frames.put((generation, e))
+    
+    def _drain_frames(self, item: Tuple) -> Tuple[List, Optional[Exception]]:
+        """Collect item plus every current-connection frame already queued
+        
+        Stops at the first connection error, returned separately so frames
+        received before it are still processed.
+        """
+        generation = self._connection_generation
+        frames = []
+        while True:
+            item_generation, frame = item
+            # Frames from replaced connections and close() wakeups are skipped
+            if item_generation == generation and frame is not None:
+                if isinstance(frame, Exception):
+                    return frames, frame
+                frames.append(frame)
+                if len(frames) >= WS_MAX_BURST:
+                    break
+            try:
+                item = self._frames.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        return frames, None
+    
+    async def _process_frames(self, frames: List):
+        """Publish ticker updates and batch the klines of one burst of frames"""
+        previous_count = self.messages_received
+        self.messages_received += len(frames)
+        self.last_message_time = time.time()
+        
+        # Log metrics periodically (every 1000 messages)
+        if self.messages_received // 1000 != previous_count // 1000:
+            metrics = self.get_metrics()
+            logger.info(
+                f"WebSocket metrics: {metrics['messages_received']} messages received, "
+                f"{metrics['parse_errors']} parse errors, "
+                f"{metrics['reconnect_count']} reconnects, "
+                f"{self.candles_saved} candles saved, {self.candles_failed} failed, "
+                f"batch_buffer={metrics['batch_buffer_size']}/{metrics['batch_size']}, "
+                f"batches_flushed={self.total_batches_flushed}, "
+                f"connected: {metrics['is_connected']}"
+            )
+        
+        loads = orjson.loads
+        kline_messages = []
+        ticker_events = []
+        for message_str in frames:
+            # Parse message
+            try:
+                message = loads(message_str)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON message: {e}, message: {message_str[:200]}")
+                continue
+            
+            # Check if this is a ticker message (for real-time price/volume updates)
+            ticker_data = self.parse_ticker_message(message)
+            if ticker_data:
+                # Real-time price/volume update; ticker messages don't need database operations
+                ticker_events.append({
+                    "symbol": ticker_data.get("symbol"),
+                    "price": ticker_data.get("price"),
+                    "volume_24h": ticker_data.get("volume_24h"),
+                    "change24h": ticker_data.get("change24h"),
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                })
+                continue
+            kline_messages.append(message)
+        
+        if ticker_events:
+            try:
+                publish_events("symbol_update", ticker_events)
+            except Exception as e:
+                logger.debug(f"Failed to publish ticker updates: {e}")
+        
+        # Kline messages (candle data) are parsed and buffered together
+        klines = self.parse_kline_messages(kline_messages)
+        if klines:
+            try:
+                # Add to batch buffer; the writer task flushes it
+                self.candles_failed += len(klines) - await self.save_candles_from_websocket(klines)
+            except Exception as save_error:
+                self.candles_failed += len(klines)
+                logger.error(f"Failed to process candles (exception): {save_error}", exc_info=True)
+    
+    async def _wake_on_shutdown(self, shutdown_event: asyncio.Event):
+        """Unblock the frame consumer when shutdown is requested"""
+        await shutdown_event.wait()
+        await self._frames.put((None, None))
+    
+    async def _stop_readers(self):
+        for task in self._reader_tasks:
+            task.cancel()
+        if self._reader_tasks:
+            await asyncio.gather(*self._reader_tasks, return_exceptions=True)
+        self._reader_tasks = []
     
     async def connect_and_subscribe(self, symbols: List[str], timeframes: List[str]):
         """Connect to WebSocket(s) and subscribe to kline streams, splitting into batches if needed"""
@@ -663,8 +921,7 @@ class BinanceWebSocketService:
         # Validate timeframes are supported by Binance
         for tf in timeframes:
             mapped = self.map_timeframe_to_binance_interval(tf)
-            valid_intervals = ["1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M"]
-            if mapped not in valid_intervals:
+            if mapped not in BINANCE_INTERVALS:
                 logger.warning(f"Timeframe {tf} (mapped to {mapped}) may not be supported by Binance")
         
         # Close existing connections
@@ -706,7 +963,10 @@ class BinanceWebSocketService:
                     websockets.connect(
                         url, 
                         ping_interval=WS_PING_INTERVAL, 
-                        ping_timeout=WS_PING_TIMEOUT
+                        ping_timeout=WS_PING_TIMEOUT,
+                        # Off by default: streams are small JSON and inflate is per-frame CPU
+                        compression="deflate" if WS_COMPRESSION else None,
+                        max_queue=WS_MAX_QUEUE
                     ),
                     timeout=10.0
                 )
@@ -727,6 +987,14 @@ class BinanceWebSocketService:
         
         # Update connection status
         if connected_count > 0:
+            self._connection_generation += 1
+            self._reader_tasks = [
+                asyncio.create_task(
+                    self._read_frames(ws, self._connection_generation),
+                    name=f"websocket_reader_{idx}"
+                )
+                for idx, ws in enumerate(self.websockets)
+            ]
             self.is_connected = True
             self.reconnect_delay = 1  # Reset delay on successful connection
             # For backward compatibility, set self.websocket to first connection
@@ -740,18 +1008,16 @@ class BinanceWebSocketService:
             return False
     
     async def listen_and_process(self, symbols: List[str], timeframes: List[str], shutdown_event=None):
-        """Listen to WebSocket messages and process kline data with improved error handling"""
-        candles_saved = 0
-        candles_failed = 0
-        
-        # Test database connection on startup
-        try:
-            with DatabaseManager() as test_db:
-                test_db.execute(text("SELECT 1"))
-            logger.info("Database connection test successful")
-        except Exception as e:
-            logger.error(f"Database connection test failed: {e}", exc_info=True)
+        """Listen to WebSocket messages and process kline data with improved error handling
         
+        Frames from every connection arrive on one queue fed by a reader task per
+        connection; candles are handed to a single long-lived writer task.
+        """
+        writer_task = asyncio.create_task(self._flush_loop(), name="websocket_batch_writer")
+        shutdown_task = (
+            asyncio.create_task(self._wake_on_shutdown(shutdown_event), name="websocket_shutdown_wakeup")
+            if shutdown_event else None
+        )
         try:
             while shutdown_event is None or not shutdown_event.is_set():
                 try:
@@ -769,170 +1035,25 @@ class BinanceWebSocketService:
                         if not success:
                             continue
                     
-                    # Receive message from any connected WebSocket (with shutdown check)
-                    if not self.websockets:
-                        # No active connections, try to reconnect
-                        await asyncio.sleep(self.reconnect_delay)
-                        self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
-                        success = await self.connect_and_subscribe(symbols, timeframes)
-                        if not success:
-                            continue
-                        continue
-                    
-                    # Use asyncio.wait to receive from any of the WebSocket connections
-                    try:
-                        # Create tasks from coroutines (required by asyncio.wait)
-                        recv_tasks = [asyncio.create_task(ws.recv()) for ws in self.websockets]
-                        
-                        done, pending = await asyncio.wait(
-                            recv_tasks,
-                            timeout=30.0,
-                            return_when=asyncio.FIRST_COMPLETED
-                        )
-                        
-                        if shutdown_event and shutdown_event.is_set():
-                            # Cancel all tasks if shutting down
-                            for task in pending:
-                                task.cancel()
-                            break
-                        
-                        if not done:
-                            # Timeout - cancel all tasks and check shutdown
-                            for task in recv_tasks:
-                                task.cancel()
-                                try:
-                                    await task
-                                except (asyncio.CancelledError, Exception):
-                                    pass
-                            if shutdown_event and shutdown_event.is_set():
-                                break
-                            continue
-                        
-                        # Get message from the first completed connection
-                        message_task = done.pop()
-                        try:
-                            message_str = await message_task
-                        except ConnectionClosedOK:
-                            # Normal closure - connection was closed intentionally
-                            logger.debug("WebSocket connection closed normally during message receive")
-                            # Cancel pending tasks
-                            for task in pending:
-                                task.cancel()
-                                try:
-                                    await task
-                                except (asyncio.CancelledError, ConnectionClosedOK):
-                                    pass
-                            # Close and reconnect
-                            await self.close()
-                            await asyncio.sleep(self.reconnect_delay)
-                            continue
-                        
-                        # Cancel pending tasks (we only process one message at a time)
-                        for task in pending:
-                            task.cancel()
-                            try:
-                                await task
-                            except (asyncio.CancelledError, ConnectionClosedOK):
-                                pass
-                    except asyncio.TimeoutError:
-                        # Check shutdown on timeout
-                        if shutdown_event and shutdown_event.is_set():
-                            break
-                        continue
-                    except ConnectionClosedOK:
-                        # Normal WebSocket closure (status 1000) - not an error
-                        # This happens when connections are closed intentionally (e.g., during symbol updates)
-                        logger.debug("WebSocket connection closed normally, will reconnect")
-                        await self.close()
-                        await asyncio.sleep(self.reconnect_delay)
-                        continue
-                    except (ConnectionClosed, WebSocketException) as e:
-                        # Abnormal WebSocket closure or error
-                        logger.warning(f"WebSocket connection closed abnormally: {e}")
-                        await self.close()
-                        await asyncio.sleep(self.reconnect_delay)
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error receiving WebSocket message: {e}", exc_info=True)
-                        # Reconnect on error
-                        await self.close()
-                        await asyncio.sleep(self.reconnect_delay)
-                        continue
+                    # Next frame from any connected WebSocket, handled together
+                    # with every frame already queued behind it
+                    item = await self._frames.get()
                     
                     if shutdown_event and shutdown_event.is_set():
                         break
                     
-                    self.messages_received += 1
-                    self.last_message_time = time.time()
-                    
-                    # Log metrics periodically (every 1000 messages)
-                    if self.messages_received % 1000 == 0:
-                        metrics = self.get_metrics()
-                        logger.info(
-                            f"WebSocket metrics: {metrics['messages_received']} messages received, "
-                            f"{metrics['parse_errors']} parse errors, "
-                            f"{metrics['reconnect_count']} reconnects, "
-                            f"{candles_saved} candles saved, {candles_failed} failed, "
-                            f"batch_buffer={metrics['batch_buffer_size']}/{metrics['batch_size']}, "
-                            f"batches_flushed={self.total_batches_flushed}, "
-                            f"connected: {metrics['is_connected']}"
-                        )
-                    
-                    # Parse message
-                    try:
-                        message = json.loads(message_str)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse JSON message: {e}, message: {message_str[:200]}")
-                        continue
-                    
-                    # Check if this is a ticker message (for real-time price/volume updates)
-                    ticker_data = self.parse_ticker_message(message)
-                    if ticker_data:
-                        try:
-                            # Publish real-time price/volume update
-                            publish_event("symbol_update", {
-                                "symbol": ticker_data.get("symbol"),
-                                "price": ticker_data.get("price"),
-                                "volume_24h": ticker_data.get("volume_24h"),
-                                "change24h": ticker_data.get("change24h"),
-                                "timestamp": datetime.now(timezone.utc).isoformat()
-                            })
-                        except Exception as e:
-                            logger.debug(f"Failed to publish ticker update for {ticker_data.get('symbol')}: {e}")
-                        # Continue processing (ticker messages don't need database operations)
-                        continue
+                    frames, connection_error = self._drain_frames(item)
+                    if frames:
+                        await self._process_frames(frames)
                     
-                    # Check if this is a kline message (for candle data)
-                    kline_data = self.parse_kline_message(message)
-                    
-                    if kline_data:
-                        try:
-                            # Add to batch buffer (thread-safe)
-                            success = await self.save_candle_from_websocket(kline_data)
-                            
-                            # Check if we should flush the batch
-                            async with self._batch_lock:
-                                batch_size = len(self.batch_buffer)
-                                should_flush = (
-                                    batch_size >= self.batch_size or
-                                    (time.time() - self.last_batch_flush) >= self.batch_timeout
-                                )
-                            
-                            if should_flush:
-                                batch_saved, batch_failed = await self.flush_batch()
-                                candles_saved += batch_saved
-                                candles_failed += batch_failed
-                                self.last_batch_flush = time.time()
-                            
-                            if not success:
-                                candles_failed += 1
-                                logger.warning(
-                                    f"Failed to add candle to batch: "
-                                    f"{kline_data.get('symbol', 'unknown')} {kline_data.get('timeframe', 'unknown')}"
-                                )
-                        except Exception as save_error:
-                            candles_failed += 1
-                            logger.error(f"Failed to process candle (exception): {save_error}", exc_info=True)
+                    if connection_error is not None:
+                        if isinstance(connection_error, ConnectionClosedOK):
+                            # Normal WebSocket closure (status 1000) - not an error
+                            logger.debug("WebSocket connection closed normally, will reconnect")
+                            await self.close()
+                            await asyncio.sleep(self.reconnect_delay)
+                            continue
+                        raise connection_error
                     
                 except (ConnectionClosed, WebSocketException) as e:
                     logger.warning(
@@ -943,33 +1064,33 @@ class BinanceWebSocketService:
                     self.is_connected = False
                     self.reconnect_count += 1
                     
-                    # Try to flush any pending batch before closing (batch will be persisted in close())
-                    async with self._batch_lock:
-                        if self.batch_buffer:
-                            try:
-                                await self.flush_batch()
-                            except Exception as flush_error:
-                                logger.error("error_flushing_before_close", error=str(flush_error))
-                    
                     # Close all connections (this will persist batch buffer)
                     await self.close()
                 except Exception as e:
                     logger.error(f"Error processing WebSocket message: {e}", exc_info=True)
                     await asyncio.sleep(1)
         finally:
+            if shutdown_task:
+                shutdown_task.cancel()
+            writer_task.cancel()
+            await asyncio.gather(
+                writer_task, *([shutdown_task] if shutdown_task else []), return_exceptions=True
+            )
+            
             # Flush any remaining batch items (batch will be persisted in close() if flush fails)
-            async with self._batch_lock:
-                if self.batch_buffer:
-                    try:
-                        batch_saved, batch_failed = await self.flush_batch()
-                        candles_saved += batch_saved
-                        candles_failed += batch_failed
-                        logger.info(f"Flushed final batch: {batch_saved} saved, {batch_failed} failed")
-                    except Exception as e:
-                        logger.error(f"Error flushing final batch: {e}")
-                        # Batch will be persisted by close() if available
+            if self.batch_buffer:
+                try:
+                    batch_saved, batch_failed = await self.flush_batch()
+                    self.candles_saved += batch_saved
+                    self.candles_failed += batch_failed
+                    logger.info(f"Flushed final batch: {batch_saved} saved, {batch_failed} failed")
+                except Exception as e:
+                    logger.error(f"Error flushing final batch: {e}")
+                    # Batch will be persisted by close() if available
             
-            logger.info(f"WebSocket listener stopped. Total: {candles_saved} saved, {candles_failed} failed")
+            logger.info(
+                f"WebSocket listener stopped. Total: {self.candles_saved} saved, {self.candles_failed} failed"
+            )
     
     async def start(self, symbols: List[str], timeframes: List[str], shutdown_event=None):
         """Start WebSocket service with reconnection logic and fallback to REST API
@@ -1030,7 +1151,7 @@ class BinanceWebSocketService:
         
         from services.binance_service import BinanceIngestionService
         
-        async with BinanceIngestionService() as binance_service:
+        async with BinanceIngestionService(self.http_session) as binance_service:
             poll_interval = 60  # Poll every 60 seconds
             
             while shutdown_event is None or not shutdown_event.is_set():
@@ -2,6 +2,7 @@
 import sys
 import os
 import asyncio
+from collections import Counter
 from datetime import datetime, timezone
 from typing import List, Set, Optional, Dict, Tuple
 from decimal import Decimal
@@ -16,10 +17,21 @@ from shared.database import DatabaseManager
 
 # Import from local modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from database.repository import get_timeframe_id, get_or_create_symbol_record, get_ingestion_config_value
+from database.repository import (
+    get_timeframe_id,
+    get_or_create_symbol_record,
+    get_ingestion_config_value,
+    bulk_execute_values
+)
 
 logger = structlog.get_logger(__name__)
 
+# Shared by every concurrent backfill run (gap detection, reactivation backfills)
+# so together they stay within the DB pool (pool_size=10) and leave room for
+# websocket flushes and the periodic market data update
+BACKFILL_MAX_IN_FLIGHT = 8
+_backfill_in_flight = asyncio.Semaphore(BACKFILL_MAX_IN_FLIGHT)
+
 
 async def backfill_recent_candles(
     binance_service,
@@ -374,29 +386,39 @@ async def backfill_recent_candles(
         try:
             # Update mismatched candles
             if candles_to_update:
-                update_stmt = text("""
-                    UPDATE ohlcv_candles
-                    SET open = :open,
-                        high = :high,
-                        low = :low,
-                        close = :close,
-                        volume = :volume
-                    WHERE symbol_id = :symbol_id
-                    AND timeframe_id = :timeframe_id
-                    AND timestamp = :timestamp
-                """)
-                
-                for candle in candles_to_update:
-                    db.execute(update_stmt, {
-                        "symbol_id": symbol_id,
-                        "timeframe_id": timeframe_id,
-                        "timestamp": candle.timestamp,
-                        "open": Decimal(str(candle.open)),
-                        "high": Decimal(str(candle.high)),
-                        "low": Decimal(str(candle.low)),
-                        "close": Decimal(str(candle.close)),
-                        "volume": Decimal(str(candle.volume))
-                    })
+                # One UPDATE ... FROM (VALUES ...) instead of one statement per candle
+                bulk_execute_values(
+                    db,
+                    """
+                    UPDATE ohlcv_candles AS c
+                    SET open = v.open,
+                        high = v.high,
+                        low = v.low,
+                        close = v.close,
+                        volume = v.volume
+                    FROM (VALUES %s) AS v (symbol_id, timeframe_id, timestamp, open, high, low, close, volume)
+                    WHERE c.symbol_id = v.symbol_id
+                    AND c.timeframe_id = v.timeframe_id
+                    AND c.timestamp = v.timestamp
+                    """,
+                    [
+                        (
+                            symbol_id,
+                            timeframe_id,
+                            candle.timestamp,
+                            Decimal(str(candle.open)),
+                            Decimal(str(candle.high)),
+                            Decimal(str(candle.low)),
+                            Decimal(str(candle.close)),
+                            Decimal(str(candle.volume))
+                        )
+                        for candle in candles_to_update
+                    ],
+                    template=(
+                        "(%s::integer, %s::integer, %s::timestamptz, "
+                        "%s::numeric, %s::numeric, %s::numeric, %s::numeric, %s::numeric)"
+                    )
+                )
                 
                 logger.info(
                     "backfill_candles_updated",
@@ -520,10 +542,11 @@ async def backfill_all_symbols_timeframes(
     
     # Create semaphore to limit concurrent requests
     semaphore = asyncio.Semaphore(max_concurrent)
+    failures_by_timeframe: Counter = Counter()
     
     async def backfill_with_semaphore(symbol: str, timeframe: str) -> int:
-        """Wrapper to limit concurrent requests"""
-        async with semaphore:
+        """Wrapper to limit concurrent requests (per run and process-wide)"""
+        async with semaphore, _backfill_in_flight:
             try:
                 return await backfill_recent_candles(
                     binance_service=binance_service,
@@ -540,35 +563,41 @@ async def backfill_all_symbols_timeframes(
                     error=str(e),
                     exc_info=True
                 )
+                failures_by_timeframe[timeframe] += 1
                 return 0
     
-    # Create all tasks
-    tasks = [
-        backfill_with_semaphore(symbol, timeframe)
-        for symbol in symbols
-        for timeframe in timeframes
-    ]
+    # Execute tasks in parallel (limited by semaphores). The wrapper handles
+    # per-task errors, so the TaskGroup only aborts on cancellation, which it
+    # then propagates to every pending backfill.
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(backfill_with_semaphore(symbol, timeframe))
+            for symbol in symbols
+            for timeframe in timeframes
+        ]
     
-    # Execute tasks in parallel (limited by semaphore)
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    total_inserted = sum(task.result() for task in tasks)
     
-    # Sum results, handling exceptions
-    for result in results:
-        if isinstance(result, Exception):
-            logger.error(
-                "backfill_task_exception",
-                error=str(result),
-                exc_info=True
-            )
-        else:
-            total_inserted += result
+    # Per-timeframe outcome: a timeframe where every symbol failed points at
+    # that timeframe (or its endpoint), not at individual symbols
+    if failures_by_timeframe:
+        logger.warning(
+            "backfill_timeframe_failures",
+            failures_by_timeframe=dict(failures_by_timeframe),
+            failed_timeframes=[
+                timeframe for timeframe in timeframes
+                if failures_by_timeframe[timeframe] == len(symbols)
+            ],
+            symbol_count=len(symbols)
+        )
     
     logger.info(
         "backfill_all_completed",
         total_candles_inserted=total_inserted,
         symbol_count=len(symbols),
         timeframe_count=len(timeframes),
-        total_tasks=len(tasks)
+        total_tasks=len(tasks),
+        failed_tasks=sum(failures_by_timeframe.values())
     )
     
     return total_inserted
@@ -0,0 +1,24 @@
+"""Shared aiohttp session factory for Binance/CoinGecko REST calls"""
+import aiohttp
+
+# Connection pool sizing for the process-wide session
+HTTP_CONNECTION_LIMIT = 256  # Total open sockets across all hosts
+HTTP_CONNECTION_LIMIT_PER_HOST = 64  # Sockets per API host (fapi.binance.com, api.coingecko.com)
+HTTP_KEEPALIVE_TIMEOUT = 75  # Seconds an idle keep-alive socket stays in the pool
+HTTP_DNS_CACHE_TTL = 300  # Seconds to cache DNS lookups
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create a ClientSession backed by a pooled, keep-alive TCP connector
+
+    Must be called from within a running event loop. The session is meant to
+    be shared by every service for the lifetime of the process so TLS
+    connections to the exchanges are reused instead of re-handshaked.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(connector=connector)
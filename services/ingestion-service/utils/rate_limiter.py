@@ -1,4 +1,7 @@
 """Rate limiting utilities for API calls"""
+import asyncio
+import time
+from typing import Mapping
 from aiolimiter import AsyncLimiter
 import structlog
 
@@ -16,3 +19,78 @@ BINANCE_BURST_LIMIT = AsyncLimiter(max_rate=100, time_period=60)  # 100 requests
 COINGECKO_RATE_LIMIT = AsyncLimiter(max_rate=1, time_period=1)  # 1 request per second (conservative)
 COINGECKO_MINUTE_LIMIT = AsyncLimiter(max_rate=30, time_period=60)  # 30 requests per minute
 
+
+# Binance reports the IP's request weight used in the current minute
+BINANCE_WEIGHT_LIMIT_1M = 2400
+BINANCE_WEIGHT_SOFT_LIMIT = 2100  # Pause new requests above this to avoid 429/418 bans
+
+
+def retry_after_seconds(headers: Mapping[str, str], default: float) -> float:
+    """Delay requested by a Retry-After header (seconds form), else default"""
+    value = headers.get("Retry-After")
+    try:
+        return max(float(value), 0.0) if value is not None else default
+    except ValueError:
+        # HTTP-date form is not used by Binance/CoinGecko; fall back to backoff
+        return default
+
+
+def binance_klines_weight(limit: int) -> int:
+    """Request weight Binance charges for GET /fapi/v1/klines with this limit"""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class BinanceWeightTracker:
+    """Token bucket over Binance's per-minute request weight
+    
+    Each request reserves its weight up front, so a burst of concurrent
+    requests is held before it crosses the soft limit rather than after the
+    first 429. X-MBX-USED-WEIGHT-1M from responses corrects the local count
+    (it also includes weight used by other processes on the same IP).
+    """
+    
+    def __init__(self, soft_limit: int = BINANCE_WEIGHT_SOFT_LIMIT):
+        self.soft_limit = soft_limit
+        self.used_weight = 0
+        self._window = 0  # Wall-clock minute the count belongs to
+    
+    def _roll_window(self):
+        # Binance weight windows reset on wall-clock minute boundaries
+        window = int(time.time() // 60)
+        if window != self._window:
+            self._window = window
+            self.used_weight = 0
+    
+    def record(self, headers: Mapping[str, str]):
+        """Update used weight from a Binance response's headers"""
+        value = headers.get("X-MBX-USED-WEIGHT-1M")
+        if value and value.isdigit():
+            self._roll_window()
+            # Reservations for requests still in flight may be ahead of the header
+            self.used_weight = max(self.used_weight, int(value))
+    
+    async def acquire(self, weight: int = 1):
+        """Reserve weight for one request, sleeping to the next window if it would exceed the soft limit"""
+        while True:
+            self._roll_window()
+            if self.used_weight + weight <= self.soft_limit:
+                self.used_weight += weight
+                return
+            pause = 60 - time.time() % 60
+            logger.warning(
+                "binance_weight_near_limit",
+                used_weight=self.used_weight,
+                request_weight=weight,
+                soft_limit=self.soft_limit,
+                pause_seconds=round(pause, 1)
+            )
+            await asyncio.sleep(pause)
+
+
+BINANCE_WEIGHT_TRACKER = BinanceWeightTracker()
@@ -0,0 +1,159 @@
+"""Single-loop scheduler for periodic ingestion jobs"""
+import asyncio
+import heapq
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Tuple
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Retry backoff for a job that raised: base * 2**(failures - 1) seconds,
+# jittered to 50-150% and capped at the smaller of this and the job interval
+JOB_BACKOFF_BASE = 5
+JOB_BACKOFF_MAX = 300
+
+
+@dataclass
+class PeriodicJob:
+    """A coroutine function run every `interval` seconds
+
+    The function may return a number of seconds to run again sooner than the
+    next regular slot (e.g. a short retry delay after a failure). If it raises,
+    the job is retried with jittered exponential backoff instead. A job with
+    repeat=False is dropped after its first run that neither raises nor asks
+    to be retried; `interval` then only caps the backoff.
+    """
+    name: str
+    func: Callable[[], Awaitable[Optional[float]]]
+    interval: float
+    repeat: bool = True
+    next_due: float = 0.0
+    task: Optional[asyncio.Task] = None
+    consecutive_failures: int = 0
+
+
+class PeriodicScheduler:
+    """Drives periodic jobs from one heap of due times on the monotonic loop clock
+
+    The loop sleeps until the earliest due job (or shutdown), starts every job
+    that is due as a task, and re-arms a job once its run finishes so a slow
+    run never overlaps itself. Slots missed by a long run are skipped.
+
+    Shutdown is driven by shutdown_event: no new runs start, in-flight runs
+    get drain_timeout seconds to finish, and only stragglers are cancelled.
+    """
+
+    def __init__(self, shutdown_event: asyncio.Event, drain_timeout: float = 30.0):
+        self._shutdown_event = shutdown_event
+        self._drain_timeout = drain_timeout
+        self._jobs: List[PeriodicJob] = []
+        self._heap: List[Tuple[float, int, PeriodicJob]] = []
+        self._counter = itertools.count()  # Tie-breaker so jobs are never compared
+        self._wakeup = asyncio.Event()
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Optional[float]]],
+        interval: float,
+        first_delay: Optional[float] = None,
+        repeat: bool = True
+    ):
+        """Register a job; first run after first_delay seconds (default: one interval)"""
+        job = PeriodicJob(name=name, func=func, interval=interval, repeat=repeat)
+        job.next_due = interval if first_delay is None else first_delay  # Made absolute in run()
+        self._jobs.append(job)
+
+    def _push(self, job: PeriodicJob):
+        heapq.heappush(self._heap, (job.next_due, next(self._counter), job))
+        self._wakeup.set()
+
+    def _rearm(self, job: PeriodicJob, retry_in: Optional[float]):
+        now = asyncio.get_running_loop().time()
+        if retry_in is not None:
+            job.next_due = now + retry_in
+        else:
+            job.next_due += job.interval
+            if job.next_due < now:
+                skipped = math.ceil((now - job.next_due) / job.interval)
+                job.next_due += skipped * job.interval
+                logger.warning("scheduled_job_slots_skipped", job=job.name, skipped=skipped)
+        self._push(job)
+
+    @staticmethod
+    def _backoff_delay(job: PeriodicJob) -> float:
+        # Jitter keeps replicas that failed together from retrying in lockstep
+        delay = min(JOB_BACKOFF_MAX, job.interval, JOB_BACKOFF_BASE * 2 ** (job.consecutive_failures - 1))
+        return delay * (0.5 + random.random())
+
+    async def _run_job(self, job: PeriodicJob):
+        retry_in = None
+        try:
+            retry_in = await job.func()
+            job.consecutive_failures = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.consecutive_failures += 1
+            retry_in = self._backoff_delay(job)
+            logger.warning(
+                "scheduled_job_backoff",
+                job=job.name,
+                error=str(e),
+                consecutive_failures=job.consecutive_failures,
+                retry_in=retry_in
+            )
+        if self._shutdown_event.is_set():
+            return
+        if job.repeat or retry_in is not None:
+            self._rearm(job, retry_in)
+        else:
+            logger.info("scheduled_job_finished", job=job.name)
+
+    async def run(self):
+        """Run until shutdown_event is set, then drain in-flight jobs"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for job in self._jobs:
+            job.next_due += start
+            self._push(job)
+        logger.info("scheduler_started", jobs=[job.name for job in self._jobs])
+
+        shutdown_wait = asyncio.ensure_future(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                now = loop.time()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, job = heapq.heappop(self._heap)
+                    job.task = asyncio.create_task(self._run_job(job), name=job.name)
+
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._wakeup.clear()
+                wakeup_wait = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait(
+                        {shutdown_wait, wakeup_wait},
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    wakeup_wait.cancel()
+        finally:
+            shutdown_wait.cancel()
+            await self._stop_jobs()
+            logger.info("scheduler_stopped")
+
+    async def _stop_jobs(self):
+        running = [job.task for job in self._jobs if job.task and not job.task.done()]
+        if not running:
+            return
+        logger.info("scheduler_draining", jobs=[task.get_name() for task in running])
+        _, pending = await asyncio.wait(running, timeout=self._drain_timeout)
+        for task in pending:
+            logger.warning("scheduled_job_cancelled_on_shutdown", job=task.get_name())
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -19,6 +19,7 @@ from shared.database import DatabaseManager
 from database.watchlist_sync import sync_watchlist, cleanup_old_inactive_symbols, get_active_symbols
 from services.binance_service import BinanceIngestionService
 from services.coingecko_service import CoinGeckoIngestionService
+from utils.http_client import create_http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -35,8 +36,10 @@ async def get_current_watchlist() -> List[str]:
     """
     logger.info("fetching_current_watchlist")
     
-    async with BinanceIngestionService() as binance_service:
-        async with CoinGeckoIngestionService() as coingecko_service:
+    # One pooled session for both services instead of one per service
+    async with create_http_session() as http_session:
+        async with BinanceIngestionService(http_session) as binance_service, \
+                CoinGeckoIngestionService(http_session) as coingecko_service:
             # Get enriched assets (this is our watchlist)
             enriched_assets = await coingecko_service.ingest_from_binance_perpetuals(
                 binance_service=binance_service
@@ -3,12 +3,19 @@ Alert Generator
 
 This module generates trading alerts from confirmed Fibonacci levels.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 from core.models import ConfirmedFibResult
 from config.settings import StrategyConfig
 
 
+def _swing_point(point) -> Tuple[Optional[int], Optional[float]]:
+    """Split a (datetime, price) swing tuple, or return (None, None) if malformed"""
+    if point and isinstance(point, (tuple, list)) and len(point) >= 2:
+        return point[0], point[1]
+    return None, None
+
+
 class AlertGenerator:
     """Generates trading alerts from confirmed Fibonacci levels."""
     
@@ -42,6 +49,14 @@ class AlertGenerator:
         """
         alerts = []
         
+        # Fib factors are the same for every level; resolve them once
+        config = self.config
+        bullish_sl_fib = float(config.bullish_sl_fib_level)
+        bearish_sl_fib = float(config.bearish_sl_fib_level)
+        tp1_fib = float(config.tp1_fib_level)
+        tp2_fib = float(config.tp2_fib_level)
+        tp3_fib = float(config.tp3_fib_level)
+        
         for level in confirmed_levels:
             right_high = level.right_high
             left_high = level.left_high
@@ -57,12 +72,9 @@ class AlertGenerator:
             
             try:
                 # Extract prices and datetimes from tuples
-                low_dt = low_center[0] if isinstance(low_center, (tuple, list)) and len(low_center) >= 2 else None
-                low_price = low_center[1] if isinstance(low_center, (tuple, list)) and len(low_center) >= 2 else None
-                right_high_dt = right_high[0] if right_high and isinstance(right_high, (tuple, list)) and len(right_high) >= 2 else None
-                right_high_price = right_high[1] if right_high and isinstance(right_high, (tuple, list)) and len(right_high) >= 2 else None
-                left_high_dt = left_high[0] if left_high and isinstance(left_high, (tuple, list)) and len(left_high) >= 2 else None
-                left_high_price = left_high[1] if left_high and isinstance(left_high, (tuple, list)) and len(left_high) >= 2 else None
+                low_dt, low_price = _swing_point(low_center)
+                right_high_dt, right_high_price = _swing_point(right_high)
+                left_high_dt, left_high_price = _swing_point(left_high)
                 
                 if low_price is None or low_price <= 0:
                     continue
@@ -94,10 +106,11 @@ class AlertGenerator:
             bearish_tp3 = None
             
             if left_high_price is not None:
-                bearish_sl = low_price + (left_high_price - low_price) * self.config.bearish_sl_fib_level
-                bearish_tp1 = low_price + (left_high_price - low_price) * self.config.tp1_fib_level
-                bearish_tp2 = low_price + (left_high_price - low_price) * self.config.tp2_fib_level
-                bearish_tp3 = low_price + (left_high_price - low_price) * self.config.tp3_fib_level
+                bearish_range = left_high_price - low_price
+                bearish_sl = low_price + bearish_range * bearish_sl_fib
+                bearish_tp1 = low_price + bearish_range * tp1_fib
+                bearish_tp2 = low_price + bearish_range * tp2_fib
+                bearish_tp3 = low_price + bearish_range * tp3_fib
 
             # Calculate the sl, tp1, tp2, tp3 for bullish (only if we have right_high)
             bullish_sl = None
@@ -106,10 +119,11 @@ class AlertGenerator:
             bullish_tp3 = None
             
             if right_high_price is not None:
-                bullish_sl = right_high_price - (right_high_price - low_price) * self.config.bullish_sl_fib_level
-                bullish_tp1 = right_high_price - (right_high_price - low_price) * self.config.tp1_fib_level
-                bullish_tp2 = right_high_price - (right_high_price - low_price) * self.config.tp2_fib_level
-                bullish_tp3 = right_high_price - (right_high_price - low_price) * self.config.tp3_fib_level
+                bullish_range = right_high_price - low_price
+                bullish_sl = right_high_price - bullish_range * bullish_sl_fib
+                bullish_tp1 = right_high_price - bullish_range * tp1_fib
+                bullish_tp2 = right_high_price - bullish_range * tp2_fib
+                bullish_tp3 = right_high_price - bullish_range * tp3_fib
             
             # Extract swing high timestamp for bullish alert (right_high)
             bullish_swing_high_timestamp = right_high_dt if right_high_dt is not None and right_high_dt > 0 else None
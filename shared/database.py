@@ -20,6 +20,12 @@ engine = create_engine(
     max_overflow=20,
     pool_pre_ping=True,
     pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_use_lifo=True,  # Hand out the most recently used (warm) connection first
+    # Multi-parameter executes: INSERTs become multi-row VALUES pages and other
+    # statements go through psycopg2's execute_batch instead of a round-trip per row
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
     echo=False
 )
 
@@ -1,8 +1,12 @@
 """
 Logging configuration
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 from shared.config import LOG_LEVEL
 
 def setup_logger(name: str) -> logging.Logger:
@@ -25,3 +29,19 @@ def setup_logger(name: str) -> logging.Logger:
     
     return logger
 
+
+def start_queue_logging(logger: Optional[logging.Logger] = None) -> logging.handlers.QueueListener:
+    """
+    Move a logger's handlers behind a QueueHandler
+    
+    Records are still formatted by the caller, but the stream writes happen on
+    a listener thread, so a slow stdout never blocks an event loop. The
+    listener is flushed and stopped at interpreter exit.
+    """
+    logger = logger or logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -3,7 +3,7 @@ Redis client for caching and pub/sub
 """
 import os
 import redis
-from typing import Optional
+from typing import List, Optional
 import json
 import logging
 
@@ -35,6 +35,18 @@ def publish_event(channel: str, data: dict):
             logger.error(f"Failed to publish event: {e}")
 
 
+def publish_events(channel: str, events: List[dict]):
+    """Publish many events to one Redis channel in a single pipelined round-trip"""
+    if redis_client and events:
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for data in events:
+                pipe.publish(channel, json.dumps(data))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to publish events: {e}")
+
+
 def cache_set(key: str, value: any, ttl: int = 3600):
     """Set cache value with TTL"""
     if redis_client: